@@ -246,7 +246,7 @@ async def advanced_session_management_example():
 
     # Drop one session
     dropped_session = session_ids[0]
-    session_manager.drop_session(dropped_session)
+    await session_manager.adrop_session(dropped_session)
     print(f"🗑️  Dropped session: {dropped_session[:8]}...")
 
     # Verify session was removed
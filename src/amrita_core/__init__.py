@@ -1,3 +1,5 @@
+import asyncio
+
 from .chatmanager import ChatManager, ChatObject, ChatObjectMeta
 from .config import get_config, set_config
 from .hook.event import CompletionEvent, PreCompletionEvent
@@ -12,7 +14,8 @@ from .libchat import (
 )
 from .logging import debug_log, logger
 from .preset import PresetManager, PresetReport
-from .sessions import SessionsManager
+from .protocol import close_image_session
+from .sessions import SessionsManager, sessions_manager
 from .tools import mcp
 from .tools.manager import ToolsManager, on_tools, simple_tool
 from .tools.models import (
@@ -64,6 +67,7 @@ __all__ = [
     "UniResponse",
     "UniResponseUsage",
     "call_completion",
+    "close_image_session",
     "debug_log",
     "get_config",
     "get_last_response",
@@ -97,8 +101,7 @@ def init():
 
 def load_session(session_id: str):
     logger.info("Loading session %s......", session_id)
-    sm = SessionsManager()
-    sm.init_session(session_id)
+    sessions_manager.init_session(session_id)
 
 
 async def load_amrita():
@@ -107,4 +110,17 @@ async def load_amrita():
     if config.function_config.agent_mcp_client_enable:
         logger.info("Loading MCP clients......")
         clients = list(config.function_config.agent_mcp_server_scripts)
-        await mcp.ClientManager().initialize_scripts_all(clients)
+        await mcp.client_manager.initialize_scripts_all(clients)
+
+
+async def unload_amrita():
+    """Close the connections opened by AmritaCore, await it before the event loop shuts down"""
+    logger.info("Unloading AmritaCore......")
+    await asyncio.gather(
+        close_image_session(),
+        mcp.client_manager.close_all(),
+        *(
+            data.mcp.close_all()
+            for data in sessions_manager.get_registered_sessions().values()
+        ),
+    )
@@ -1,9 +1,13 @@
+import hashlib
+import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator, Iterable, Sequence
 from io import StringIO
 from typing import Any
 
 import anthropic
 import openai
+import pydantic_core
 from anthropic.types import TextBlock
 from openai.types.chat.chat_completion import ChatCompletion
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
@@ -40,6 +44,44 @@ def model_dump(obj: Iterable[BaseModel | dict]) -> Sequence[Any]:
     return [obj.model_dump() if isinstance(obj, BaseModel) else obj for obj in obj]
 
 
+class _ExactMatchCache:
+    """LRU cache of responses to identical requests, entries expire after their TTL"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        # Serialized in Rust straight to bytes, models are dumped by their own
+        # serializers. Keys keep insertion order, which only risks a cache miss
+        payload = pydantic_core.to_json(parts, fallback=str)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        if (entry := self._data.get(key)) is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_response_cache = _ExactMatchCache()
+"""Responses shared by all OpenAIAdapter instances, enabled by `LLMConfig.response_cache_ttl`"""
+
+
 class AnthropicAdapter(ModelAdapter):
     """Anthropic Protocol Adapter"""
 
@@ -107,11 +149,46 @@ class OpenAIAdapter(ModelAdapter):
 
     __override__ = True
 
+    def _cache_key(self, *request: Any) -> str:
+        preset: ModelPreset = self.preset
+        preset_config: ModelConfig = preset.config
+        # The key is hashed, so the credentials never sit in the cache in plain text
+        return _response_cache.make_key(
+            preset.base_url,
+            preset.api_key,
+            preset.model,
+            preset_config.top_p,
+            preset_config.temperature,
+            preset_config.stream,
+            self.config.llm.max_tokens,
+            *request,
+        )
+
     @override
     async def call_api(
         self, messages: Iterable[ChatCompletionMessageParam], *args, **kwargs
     ) -> AsyncGenerator[COMPLETION_RETURNING, None]:
         """Call OpenAI API to get chat responses"""
+        if (ttl := self.config.llm.response_cache_ttl) <= 0:
+            async for item in self._call_api(messages):
+                yield item
+            return
+        messages = list(messages)
+        key = self._cache_key("call_api", messages)
+        if (cached := _response_cache.get(key)) is not None:
+            for item in cached:
+                yield item.model_copy() if isinstance(item, UniResponse) else item
+            return
+        items: list[COMPLETION_RETURNING] = []
+        async for item in self._call_api(messages):
+            items.append(item)
+            yield item
+        # Only complete responses are cached
+        _response_cache.set(key, tuple(items), ttl)
+
+    async def _call_api(
+        self, messages: Iterable[ChatCompletionMessageParam]
+    ) -> AsyncGenerator[COMPLETION_RETURNING, None]:
         preset: ModelPreset = self.preset
         preset_config: ModelConfig = preset.config
         config: AmritaConfig = self.config
@@ -187,6 +264,22 @@ class OpenAIAdapter(ModelAdapter):
         messages: Iterable,
         tools: list,
         tool_choice: ToolChoice | None = None,
+    ) -> UniResponse[None, list[ToolCall] | None]:
+        if (ttl := self.config.llm.response_cache_ttl) <= 0:
+            return await self._call_tools(messages, tools, tool_choice)
+        messages = list(messages)
+        key = self._cache_key("call_tools", messages, tools, tool_choice)
+        if (cached := _response_cache.get(key)) is None:
+            cached = await self._call_tools(messages, tools, tool_choice)
+            _response_cache.set(key, cached, ttl)
+        # Callers may modify the tool calls, hand out a copy
+        return cached.model_copy(deep=True)
+
+    async def _call_tools(
+        self,
+        messages: Iterable,
+        tools: list,
+        tool_choice: ToolChoice | None = None,
     ) -> UniResponse[None, list[ToolCall] | None]:
         if not tool_choice:
             choice: ChatCompletionToolChoiceOptionParam = "auto"
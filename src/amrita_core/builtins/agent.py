@@ -14,7 +14,7 @@ from amrita_core.libchat import (
 )
 from amrita_core.logging import debug_log, logger
 from amrita_core.protocol import MessageWithMetadata
-from amrita_core.sessions import SessionsManager
+from amrita_core.sessions import sessions_manager
 from amrita_core.tools.manager import ToolsManager, on_tools
 from amrita_core.tools.models import ToolContext
 from amrita_core.types import CONTENT_LIST_TYPE as SEND_MESSAGES
@@ -73,7 +73,7 @@ async def _(ctx: ToolContext) -> str | None:
 async def agent_core(event: PreCompletionEvent, config: AmritaConfig) -> None:
     agent_last_step: str = ""
     session_id = event.chat_object.session_id
-    session = SessionsManager().get_session_data(session_id, None)
+    session = sessions_manager.get_session_data(session_id, None)
     tools_manager = session.tools if session else ToolsManager()
 
     async def _append_reasoning(
@@ -17,7 +17,7 @@ from pytz import utc
 from typing_extensions import Self
 
 from amrita_core.hook.exception import FallbackFailed
-from amrita_core.preset import PresetManager
+from amrita_core.preset import preset_manager
 from amrita_core.sessions import SessionData
 from amrita_core.utils import get_current_datetime_timestamp
 
@@ -27,7 +27,7 @@ from .hook.matcher import MatcherManager
 from .libchat import call_completion, get_last_response, get_tokens, text_generator
 from .logging import debug_log, logger
 from .protocol import MessageContent
-from .sessions import SessionsManager
+from .sessions import sessions_manager
 from .tokenizer import hybrid_token_count
 from .types import (
     CONTENT_LIST_TYPE,
@@ -447,7 +447,7 @@ class ChatObject:
             queue_size: Maximum number of message chunks to be stored in the queue
             overflow_queue_size: Maximum number of message chunks to be stored in the overflow queue
         """
-        sm = SessionsManager()
+        sm = sessions_manager
         if auto_create_session and not sm.is_session_registered(session_id):
             sm.init_session(session_id)
         self._raised_exc = exception_ignored
@@ -467,7 +467,7 @@ class ChatObject:
         self.preset = preset or (
             session.presets.get_default_preset()
             if session
-            else PresetManager().get_default_preset()
+            else preset_manager.get_default_preset()
         )
         # Hook args
         self._hook_args = hook_args
@@ -116,6 +116,10 @@ class LLMConfig(BaseModel):
         default=True,
         description="Whether to enable multi-modal support (currently only supports image)",
     )
+    response_cache_ttl: int = Field(
+        default=0,
+        description="Seconds to reuse the response of an identical request (same model, messages and tools), 0 disables the cache",
+    )
 
 
 class AmritaConfig(BaseModel):
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import sys
 import warnings
 from collections import defaultdict
 from collections.abc import Awaitable, Callable, Iterable
 from copy import deepcopy
+from dataclasses import dataclass
 from types import FrameType, MappingProxyType
 from typing import (
     Any,
@@ -18,7 +20,6 @@ from typing import (
 
 from deprecated.sphinx import deprecated
 from exceptiongroup import ExceptionGroup
-from pydantic import BaseModel, Field
 from typing_extensions import Self
 
 from amrita_core.config import AmritaConfig
@@ -35,13 +36,16 @@ from .exception import (
 
 ChatException: TypeAlias = MatcherException
 
+_MISSING = object()
 
-class FunctionData(BaseModel, arbitrary_types_allowed=True):
-    function: Callable[..., Awaitable[Any]] = Field(...)
-    signature: inspect.Signature = Field(...)
-    frame: FrameType = Field(...)
-    priority: int = Field(...)
-    matcher: Matcher = Field(...)
+
+@dataclass(slots=True)
+class FunctionData:
+    function: Callable[..., Awaitable[Any]]
+    signature: inspect.Signature
+    frame: FrameType
+    priority: int
+    matcher: Matcher
 
 
 class EventRegistry:
@@ -58,6 +62,14 @@ class EventRegistry:
     def register_handler(self, event_type: str, data: FunctionData):
         self._event_handlers[event_type][data.priority].append(data)
 
+    def has_handlers(self, event_type: str) -> bool:
+        """Check whether any handler has been registered for the event type."""
+        return bool(self._event_handlers.get(event_type))
+
+    def handlers(self, event_type: str) -> dict[int, list[FunctionData]]:
+        """Get handlers for the event type without creating an empty entry."""
+        return self._event_handlers.get(event_type, {})
+
     def get_handlers(self, event_type: str) -> defaultdict[int, list[FunctionData]]:
         return self._event_handlers[event_type]
 
@@ -85,10 +97,10 @@ class Matcher:
         self.block = block
 
     def append_handler(self, func: Callable[..., Awaitable[Any]]):
-        frame = inspect.currentframe()
-        assert frame is not None, "Frame is None!!!"
+        frame = sys._getframe(1)
         func_data = FunctionData(
             function=func,
+            # Computed once here, the handlers only ever read `FunctionData.signature`
             signature=inspect.signature(func),
             frame=frame,
             priority=self.priority,
@@ -270,11 +282,12 @@ class MatcherFactory:
 
         # Get keyword arguments from session_kwargs that match function signature
         kwparams: MappingProxyType[str, inspect.Parameter] = signature.parameters
-        f_kwargs: dict[str, Any] = {
-            param_name: session_kwargs[param_name]
-            for param_name in kwparams.keys()
-            if param_name in session_kwargs
-        }
+        f_kwargs: dict[str, Any] = {}
+        for param_name in kwparams:
+            # Single probe per parameter; a sentinel keeps `None` values intact
+            value = session_kwargs.get(param_name, _MISSING)
+            if value is not _MISSING:
+                f_kwargs[param_name] = value
 
         # Get default dependencies from function signature
         d_kwargs: dict[str, DependsFactory] = {
@@ -378,12 +391,16 @@ class MatcherFactory:
             bool: Should continue to run.
         """
         for func in matcher_list:
-            signature = func.signature
-            frame = func.frame
+            # Unpack once so the rest of the loop works on locals
+            handler, signature, frame, matcher = (
+                func.function,
+                func.signature,
+                func.frame,
+                func.matcher,
+            )
             line_number = frame.f_lineno
             file_name = frame.f_code.co_filename
-            handler = func.function
-            session_args = [func.matcher, event, config, *extra_args]
+            session_args = [matcher, event, config, *extra_args]
             session_kwargs: dict[str, Any] = deepcopy(extra_kwargs)
             runtime_args: dict[int, DependsFactory] = {  # index -> DependsFactory
                 k: v
@@ -419,7 +436,7 @@ class MatcherFactory:
                 )
                 if failed_args:
                     logger.warning(
-                        f"Matcher {func.function.__name__} (File: {file_name}: Line {frame.f_lineno!s}) has untyped parameters!"
+                        f"Matcher {handler.__name__} (File: {file_name}: Line {line_number!s}) has untyped parameters!"
                         + f"(Args:{''.join(i + ',' for i in failed_args)}).Skipping......"
                     )
                 continue
@@ -459,7 +476,7 @@ class MatcherFactory:
                 continue
             finally:
                 logger.info(f"Handler {handler.__name__} finished")
-                if func.matcher.block:
+                if matcher.block:
                     return False
         return True
 
@@ -551,26 +568,26 @@ class MatcherFactory:
 
         session_kwargs = kwargs
         event_type: EventTypeEnum | str = event.get_event_type()  # Get event type
-        handlers = EventRegistry().get_handlers(event_type)
-        priorities: list[int] = sorted(handlers.keys(), reverse=False)
-        debug_log(f"Running matchers for event: {event_type}!")
-        # Check if there are handlers for this event type
-        if priorities:
-            for priority in priorities:
-                logger.info(f"Running matchers for priority {priority}......")
-                if not await cls._simple_run(
-                    handlers[priority],
-                    event,
-                    config,
-                    exception_ignored,
-                    args,
-                    session_kwargs,
-                ):
-                    break
-        else:
+        registry = EventRegistry()
+        # Skip the whole dispatch for event types nobody subscribed to
+        if not registry.has_handlers(event_type):
             logger.warning(
                 f"No registered Matcher for {event_type} event, skipping processing."
             )
+            return
+        handlers = registry.handlers(event_type)
+        debug_log(f"Running matchers for event: {event_type}!")
+        for priority in sorted(handlers):
+            logger.info(f"Running matchers for priority {priority}......")
+            if not await cls._simple_run(
+                handlers[priority],
+                event,
+                config,
+                exception_ignored,
+                args,
+                session_kwargs,
+            ):
+                break
 
 
 MatcherManager = MatcherFactory
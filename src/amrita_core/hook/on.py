@@ -3,11 +3,11 @@ from .matcher import Matcher
 
 
 def on_completion(priority: int = 10, block: bool = True):
-    return on_event(EventTypeEnum.COMPLETION, priority, block)
+    return Matcher(EventTypeEnum.COMPLETION, priority, block)
 
 
 def on_precompletion(priority: int = 10, block: bool = True):
-    return on_event(EventTypeEnum.BEFORE_COMPLETION, priority, block)
+    return Matcher(EventTypeEnum.BEFORE_COMPLETION, priority, block)
 
 
 def on_preset_fallback(priority: int = 10, block: bool = True):
@@ -5,15 +5,15 @@ from collections.abc import AsyncGenerator, Generator
 
 from pydantic import ValidationError
 
-from amrita_core.preset import PresetManager
+from amrita_core.preset import preset_manager
 
 from .config import AmritaConfig, get_config
 from .logging import debug_log
 from .protocol import (
     COMPLETION_RETURNING,
-    AdapterManager,
     MessageContent,
     ModelAdapter,
+    adapter_manager,
 )
 from .tokenizer import hybrid_token_count
 from .tools.models import ToolChoice
@@ -155,7 +155,7 @@ async def _call_with_reflection(
     Returns:
         Result of the call function
     """
-    adapter_class = AdapterManager().safe_get_adapter(preset.protocol)
+    adapter_class = adapter_manager.safe_get_adapter(preset.protocol)
     if adapter_class:
         debug_log(
             f"Using adapter {adapter_class.__name__} to handle protocol {preset.protocol}"
@@ -202,7 +202,7 @@ async def tools_caller(
     ):
         return await adapter.call_tools(messages, tools, tool_choice)
 
-    preset = preset or PresetManager().get_default_preset()
+    preset = preset or preset_manager.get_default_preset()
     return await _call_with_reflection(
         preset, _call_tools, config, messages, tools, tool_choice
     )
@@ -224,7 +224,7 @@ async def call_completion(
         Individual response parts as strings or UniResponse objects
     """
     messages = _validate_msg_list(messages)
-    preset = preset or PresetManager().get_default_preset()
+    preset = preset or preset_manager.get_default_preset()
     config = config or get_config()
 
     async def _call_api(adapter: ModelAdapter, messages: CONTENT_LIST_TYPE):
@@ -1,7 +1,6 @@
 # ref: https://github.com/NoneBot/NoneBot2/blob/main/nonebot/log.py
 from __future__ import annotations
 
-import inspect
 import logging
 import os
 import sys
@@ -27,6 +26,13 @@ def debug_log(message: ToStringAble) -> None:
         logger.debug(message)
 
 
+_LOGGING_FILE: str = logging.__file__
+
+_HANDLER_DEPTH: int = 5
+"""Frames between `emit` and the stdlib logger method that produced the record
+(`Handler.handle`, `Logger.callHandlers`, `Logger.handle`, `Logger._log`)"""
+
+
 class LoguruHandler(logging.Handler):
     def emit(self, record: logging.LogRecord):
         try:
@@ -34,8 +40,17 @@ class LoguruHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        frame, depth = inspect.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+        # Jump over the fixed part of the stdlib call chain, then only walk the
+        # few remaining `logging` frames (`Logger.info`, `logging.info`, ...)
+        try:
+            frame, depth = sys._getframe(_HANDLER_DEPTH), _HANDLER_DEPTH
+        except ValueError:
+            frame = None
+        if frame is None or frame.f_code.co_filename != _LOGGING_FILE:
+            # The record didn't come through `Logger._log` (e.g. a direct
+            # `Handler.handle` call), walk out of `logging` from `emit` instead
+            frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -1,11 +1,15 @@
+import asyncio
 import random
 import time
 import typing
+from collections.abc import ValuesView
+from contextlib import aclosing
+from itertools import islice
 
 from typing_extensions import Self
 
 from .logging import debug_log, logger
-from .protocol import AdapterManager
+from .protocol import adapter_manager
 from .tokenizer import hybrid_token_count
 from .types import BaseModel, Message, ModelPreset, TextContent, UniResponse
 
@@ -25,6 +29,14 @@ TEST_MSG_LIST: list[Message[list[TextContent]]] = [
     TEST_MSG_USER,
 ]
 
+_TEST_PROMPT_TEXT: str = "".join(
+    typing.cast(TextContent, msg.content[0]).text for msg in TEST_MSG_LIST
+)
+"""Joined text of `TEST_MSG_LIST`, used for prompt token counting"""
+
+_PROMPT_TOKENS: int = hybrid_token_count(_TEST_PROMPT_TEXT)
+"""Token count of `TEST_MSG_LIST`, which never changes between preset tests"""
+
 
 class PresetReport(BaseModel):
     preset_name: str  # Name of the preset
@@ -45,6 +57,7 @@ class MultiPresetManager:
 
     _default_preset: ModelPreset | None = None
     _presets: dict[str, ModelPreset]
+    max_concurrency: int = 8  # Default number of presets tested at the same time
 
     def __init__(self) -> None:
         self._presets = {}
@@ -65,16 +78,19 @@ class MultiPresetManager:
         """
         if self._default_preset is None:
             logger.warning("No default preset set, fall back to a random preset")
-            self._default_preset = random.choice(list(self._presets.values()))
+            # Pick by index instead of copying every preset into a list
+            index = random.randrange(len(self._presets))
+            self._default_preset = next(islice(self._presets.values(), index, None))
         return self._default_preset
 
     def get_preset(self, name: str) -> ModelPreset:
         """
         Get a preset by name.
         """
-        if name not in self._presets:
-            raise ValueError(f"Preset {name} not found")
-        return self._presets[name]
+        try:
+            return self._presets[name]
+        except KeyError:
+            raise ValueError(f"Preset {name} not found") from None
 
     def add_preset(self, preset: ModelPreset) -> None:
         """
@@ -84,24 +100,19 @@ class MultiPresetManager:
             raise ValueError(f"Preset {preset.name} already exists")
         self._presets[preset.name] = preset
 
-    def get_all_presets(self) -> list[ModelPreset]:
+    def get_all_presets(self) -> ValuesView[ModelPreset]:
         """
-        Get all presets.
+        Get a live view of all presets, use `list(...)` for a snapshot.
         """
-        return list(self._presets.values())
+        return self._presets.values()
 
     async def test_single_preset(self, preset: ModelPreset | str) -> PresetReport:
         """Test a single preset for parallel execution"""
         if isinstance(preset, str):
             preset = self.get_preset(preset)
         debug_log(f"Testing preset: {preset.name}...")
-        prompt_tokens = hybrid_token_count(
-            "".join(
-                [typing.cast(TextContent, msg.content[0]).text for msg in TEST_MSG_LIST]
-            )
-        )
-
-        adapter = AdapterManager().safe_get_adapter(preset.protocol)
+        adapter = adapter_manager.safe_get_adapter(preset.protocol)
+        prompt_tokens = _PROMPT_TOKENS
         if adapter is None:
             return PresetReport(
                 preset_name=preset.name,
@@ -118,23 +129,27 @@ class MultiPresetManager:
         try:
             time_start = time.time()
             debug_log(f"Calling preset: {preset.name}...")
-            data = [  # noqa: RUF015
-                i
-                async for i in adapter(preset).call_api(TEST_MSG_LIST)
-                if isinstance(i, UniResponse)
-            ][0]
+            data: UniResponse | None = None
+            async with aclosing(adapter(preset).call_api(TEST_MSG_LIST)) as stream:
+                async for i in stream:
+                    if isinstance(i, UniResponse):
+                        data = i
+                        break
+            if data is None:
+                raise RuntimeError("Adapter returned no response")
             time_end = time.time()
             time_delta = time_end - time_start
             debug_log(
                 f"Successfully called preset {preset.name}, took {time_delta:.2f} seconds"
             )
-            return PresetReport(
+            # Every field below is produced by this method, so skip validation
+            return PresetReport.model_construct(
                 preset_name=preset.name,
                 preset_data=preset,
                 test_input=(TEST_MSG_PROMPT, TEST_MSG_USER),
-                test_output=Message[list[TextContent]](
+                test_output=Message[list[TextContent]].model_construct(
                     role="assistant",
-                    content=[TextContent(type="text", text=data.content)],
+                    content=[TextContent.model_construct(text=data.content)],
                 ),
                 token_prompt=prompt_tokens,
                 token_completion=hybrid_token_count(data.content),
@@ -156,11 +171,41 @@ class MultiPresetManager:
                 time_used=0,
             )
 
-    async def test_presets(self) -> typing.AsyncGenerator[PresetReport, None]:
-        presets: list[ModelPreset] = self.get_all_presets()
+    async def test_presets(
+        self, concurrency: int | None = None
+    ) -> typing.AsyncGenerator[PresetReport, None]:
+        """Test all presets with a pool of workers, yielding reports as they complete
+
+        Args:
+            concurrency (int | None, optional): Maximum number of presets tested at the same time. Defaults to `max_concurrency`.
+        """
+        presets: list[ModelPreset] = list(self.get_all_presets())
         debug_log(f"Starting to test all presets ({len(presets)} total)...")
+        pending: asyncio.Queue[ModelPreset] = asyncio.Queue()
         for preset in presets:
-            yield await self.test_single_preset(preset)
+            pending.put_nowait(preset)
+        results: asyncio.Queue[PresetReport | BaseException] = asyncio.Queue()
+
+        async def _worker() -> None:
+            while not pending.empty():
+                try:
+                    report = await self.test_single_preset(pending.get_nowait())
+                except Exception as e:
+                    # Hand the error to the consumer instead of leaving it waiting
+                    report = e
+                await results.put(report)
+
+        workers_count = min(max(concurrency or self.max_concurrency, 1), len(presets))
+        workers = [asyncio.create_task(_worker()) for _ in range(workers_count)]
+        try:
+            for _ in range(len(presets)):
+                report = await results.get()
+                if isinstance(report, BaseException):
+                    raise report
+                yield report
+        finally:
+            for worker in workers:
+                worker.cancel()
 
 
 class PresetManager(MultiPresetManager):
@@ -177,6 +222,11 @@ class PresetManager(MultiPresetManager):
         return cls._instance
 
     def __init__(self) -> None:
-        if not self.__class__._initialized:
-            super().__init__()
-            self.__class__._initialized = True
+        if PresetManager._initialized:
+            return
+        super().__init__()
+        PresetManager._initialized = True
+
+
+preset_manager: PresetManager = PresetManager()
+"""Shared `PresetManager` instance, use it instead of constructing the singleton"""
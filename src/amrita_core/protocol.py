@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import binascii
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Iterable
+from collections.abc import AsyncGenerator, Iterable, Mapping
 from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TypedDict
 
 import aiofiles
@@ -19,9 +22,79 @@ from .logging import logger
 from .tools.models import ToolChoice, ToolFunctionSchema
 from .types import ModelPreset, ToolCall, UniResponse
 
+_DEFAULT_IMAGE_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36"
+    }
+)
+
+_image_session: aiohttp.ClientSession | None = None
+_image_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _get_image_session() -> aiohttp.ClientSession:
+    """Get the shared session used to download images, creating it on first use"""
+    global _image_session, _image_session_loop
+    loop = asyncio.get_running_loop()
+    if (
+        (session := _image_session) is not None
+        and not session.closed
+        and _image_session_loop is loop
+    ):
+        return session
+    stale, stale_loop = _image_session, _image_session_loop
+    # Published before the stale session is closed, so concurrent callers share it
+    _image_session = session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+    )
+    _image_session_loop = loop
+    if stale is not None and stale_loop is not None:
+        await _close_session(stale, stale_loop)
+    return session
+
+
+async def _close_session(
+    session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop
+) -> None:
+    """Close a session on the event loop it was created in"""
+    if session.closed:
+        return
+    if loop is asyncio.get_running_loop() or loop.is_closed():
+        # A closed loop took the connections with it, this only marks the session closed
+        await session.close()
+    else:
+        # Its connections belong to the other loop, they are closed when it next runs
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+
+async def close_image_session() -> None:
+    """Close the shared session used to download images
 
-def get_image_format(file: Path | bytes):
-    kind: Type | None = filetype.guess(file)
+    Await it before the event loop shuts down, `unload_amrita` does this.
+    """
+    global _image_session, _image_session_loop
+    session, loop = _image_session, _image_session_loop
+    _image_session = _image_session_loop = None
+    if session is not None and loop is not None:
+        await _close_session(session, loop)
+
+
+def get_image_format(file: Path | bytes | memoryview):
+    if isinstance(file, Path):
+        with file.open("rb") as f:
+            head = f.read(12)
+    else:
+        head = bytes(file[:12])
+    # Fast path for the common formats, skipping filetype's matcher loop
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    elif head[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    elif head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    elif head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    kind: Type | None = filetype.guess(file if isinstance(file, Path) else bytes(file))
     if kind is None:
         return
     assert isinstance(kind.mime, str)
@@ -37,6 +110,8 @@ class MessageContent(ABC):
     not just strings. Subclasses should implement their own representation.
     """
 
+    __slots__ = ("type",)
+
     def __str__(self) -> str:
         return self.get_content()
 
@@ -52,6 +127,8 @@ class MessageContent(ABC):
 class RawMessageContent(MessageContent, ABC):
     """Raw message content implementation abstract class"""
 
+    __slots__ = ("raw_data",)
+
     def __init__(self, raw_data: Any):
         super().__init__("raw")
         self.raw_data = raw_data
@@ -63,6 +140,8 @@ class RawMessageContent(MessageContent, ABC):
 class StringMessageContent(MessageContent):
     """String type message content implementation"""
 
+    __slots__ = ("text",)
+
     def __init__(self, text: str):
         super().__init__("string")
         self.text = text
@@ -79,6 +158,8 @@ class MessageMetadata(TypedDict):
 class MessageWithMetadata(MessageContent):
     """Message with additional metadata"""
 
+    __slots__ = ("content", "metadata")
+
     def __init__(self, content: str, metadata: dict[str, Any]):
         super().__init__("metadata")
         self.content = content
@@ -97,6 +178,8 @@ class MessageWithMetadata(MessageContent):
 class ImageMessage(MessageContent):
     """Image message"""
 
+    __slots__ = ("_image", "_mime", "_rendered")
+
     def __init__(self, image: str | BytesIO | bytes):
         """Construct a new ImageMessage object.
 
@@ -104,37 +187,81 @@ class ImageMessage(MessageContent):
             image (str | BytesIO | bytes): The image to be responded with, str: URL, BytesIO: file object, bytes: Base64 encoded image
         """
         super().__init__("image")
-        self.image: str | BytesIO | bytes = image
+        self.image = image
+
+    _image: str | BytesIO | bytes
+    _rendered: str | None
+    _mime: str | None
+
+    @property
+    def image(self) -> str | BytesIO | bytes:
+        return self._image
+
+    @image.setter
+    def image(self, value: str | BytesIO | bytes) -> None:
+        self._image = value
+        # Rendered markdown and detected format are only valid for this image
+        self._rendered = None
+        self._mime = None
 
     async def get_image(self, headers: dict[str, Any] | None = None) -> BytesIO | bytes:
         if isinstance(self.image, str):
             self.image = await self.curl_image(headers)
         return self.image
 
+    async def _iter_chunks(
+        self, extra_headers: dict | None = None, chunk_size: int = 64 * 1024
+    ) -> AsyncGenerator[bytes, None]:
+        """Download the image from its URL, yielding the raw body in chunks"""
+        if not isinstance(self.image, str):
+            raise ValueError("Image must be a URL to use this method")
+        headers = (
+            {**_DEFAULT_IMAGE_HEADERS, **extra_headers}
+            if extra_headers
+            else _DEFAULT_IMAGE_HEADERS
+        )
+        session = await _get_image_session()
+        async with session.get(self.image, headers=headers) as response:
+            if response.status != 200:
+                raise ValueError(f"Failed to download image from {self.image}")
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def _fetch_bytes(self, extra_headers: dict | None = None) -> bytes:
+        """Download the image from its URL as raw bytes"""
+        buffer = bytearray()
+        async for chunk in self._iter_chunks(extra_headers):
+            buffer += chunk
+        return bytes(buffer)
+
     async def curl_image(self, extra_headers: dict | None = None) -> bytes:
-        if isinstance(self.image, str):
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36"
-            }
-            headers.update(extra_headers or {})
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(self.image) as response:
-                    if response.status != 200:
-                        raise ValueError(f"Failed to download image from {self.image}")
-                    bt = await response.read()
-                    obj = base64.b64encode(bt)
-                    return obj
-        raise ValueError("Image must be a URL to use this method")
+        return base64.b64encode(await self._fetch_bytes(extra_headers))
 
     def get_content(self) -> str:
-        if isinstance(self.image, str):
-            return f"![]({self.image})"
-        elif isinstance(self.image, BytesIO):
-            self.image = self.image.getvalue()
-        image_type = get_image_format(self.image)
-        if not image_type:
-            return "[Unsupported image format]"
-        return f"![](data:image/{image_type};base64,{self.image.decode('utf-8')})"
+        if self._rendered is not None:
+            return self._rendered
+        data = self.image
+        if isinstance(data, str):
+            return f"![]({data})"
+        elif isinstance(data, BytesIO):
+            self.image = data = data.getvalue()
+        if image_type := get_image_format(data):
+            encoded = base64.b64encode(data).decode("ascii")
+        else:
+            # Bytes may already be base64 encoded (e.g. from `curl_image`),
+            # so sniff the format from the decoded header only
+            try:
+                image_type = get_image_format(
+                    base64.b64decode(data[:24], validate=True)
+                )
+            except (binascii.Error, ValueError):
+                image_type = None
+            if not image_type:
+                return "[Unsupported image format]"
+            encoded = data.decode("ascii")
+        self._mime = f"image/{image_type}"
+        self._rendered = f"![](data:{self._mime};base64,{encoded})"
+        return self._rendered
 
     async def save_to(self, path: Path, headers: dict | None = None):
         async with aiofiles.open(path, "wb") as f:
@@ -143,7 +270,8 @@ class ImageMessage(MessageContent):
             elif isinstance(self.image, bytes):
                 await f.write(self.image)
             else:
-                await f.write(await self.curl_image(headers))
+                async for chunk in self._iter_chunks(headers):
+                    await f.write(chunk)
 
 
 COMPLETION_RETURNING = MessageContent | str | UniResponse[str, None]
@@ -160,7 +288,7 @@ class ModelAdapter:
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
         if not getattr(cls, "__abstract__", False):
-            AdapterManager().register_adapter(cls)
+            adapter_manager.register_adapter(cls)
 
     @abstractmethod
     async def call_api(
@@ -189,6 +317,7 @@ class ModelAdapter:
 class AdapterManager:
     __instance = None
     _adapter_class: dict[str, type[ModelAdapter]]
+    _frozen: bool = False
 
     def __new__(cls):
         if cls.__instance is None:
@@ -196,9 +325,9 @@ class AdapterManager:
             cls.__instance._adapter_class = {}
         return cls.__instance
 
-    def get_adapters(self) -> dict[str, type[ModelAdapter]]:
-        """Get all registered adapters"""
-        return self._adapter_class
+    def get_adapters(self) -> Mapping[str, type[ModelAdapter]]:
+        """Get a read-only view of all registered adapters"""
+        return MappingProxyType(self._adapter_class)
 
     def safe_get_adapter(self, protocol: str) -> type[ModelAdapter] | None:
         """Get adapter"""
@@ -210,33 +339,49 @@ class AdapterManager:
             raise ValueError(f"No adapter found for protocol {protocol}")
         return self._adapter_class[protocol]
 
+    def freeze(self) -> None:
+        """Make the registry read-only once every adapter has been registered
+
+        Lookups through `safe_get_adapter` are then served by the frozen mapping directly.
+        """
+        if self._frozen:
+            return
+        self._adapter_class = MappingProxyType(self._adapter_class)  # pyright: ignore[reportAttributeAccessIssue]
+        self.safe_get_adapter = self._adapter_class.get  # pyright: ignore[reportAttributeAccessIssue]
+        self._frozen = True
+
     def register_adapter(self, adapter: type[ModelAdapter]):
         """Register adapter"""
+        if self._frozen:
+            raise RuntimeError(
+                f"Cannot register adapter {adapter.__name__}, the adapter registry is frozen"
+            )
         protocol = adapter.get_adapter_protocol()
-        override = adapter.__override__ if hasattr(adapter, "__override__") else False
-        if isinstance(protocol, str):
-            if protocol in self._adapter_class:
-                if not override:
-                    raise ValueError(
-                        f"Model protocol adapter {protocol} is already registered"
-                    )
-                logger.warning(
-                    f"Model protocol adapter {protocol} has been registered by {self._adapter_class[protocol].__name__}, overriding existing adapter"
+        protocols = (protocol,) if isinstance(protocol, str) else protocol
+        if not isinstance(protocols, tuple) or not all(
+            isinstance(p, str) for p in protocols
+        ):
+            raise TypeError(
+                "Model protocol adapter must be a string or tuple of strings"
+            )
+        override: bool = adapter.__override__
+        for p in protocols:
+            self._register_one(p, adapter, override)
+
+    def _register_one(
+        self, protocol: str, adapter: type[ModelAdapter], override: bool
+    ) -> None:
+        reg = self._adapter_class
+        if (existing := reg.get(protocol)) is not None:
+            if not override:
+                raise ValueError(
+                    f"Model protocol adapter {protocol} is already registered"
                 )
+            logger.warning(
+                f"Model protocol adapter {protocol} has been registered by {existing.__name__}, overriding existing adapter"
+            )
+        reg[protocol] = adapter
+
 
-            self._adapter_class[protocol] = adapter
-        elif isinstance(protocol, tuple):
-            for p in protocol:
-                if not isinstance(p, str):
-                    raise TypeError(
-                        "Model protocol adapter must be a string or tuple of strings"
-                    )
-                if p in self._adapter_class:
-                    if not override:
-                        raise ValueError(
-                            f"Model protocol adapter {p} is already registered"
-                        )
-                    logger.warning(
-                        f"Model protocol adapter {p} has been registered by {self._adapter_class[p].__name__}, overriding existing adapter"
-                    )
-                self._adapter_class[p] = adapter
+adapter_manager: AdapterManager = AdapterManager()
+"""Shared `AdapterManager` instance, use it instead of constructing the singleton"""
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import threading
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TypeVar, overload
 
 from typing_extensions import Self
 
 from amrita_core.config import AmritaConfig
+from amrita_core.logging import logger
 from amrita_core.preset import MultiPresetManager
 from amrita_core.tools.mcp import MultiClientManager as ClientManager
 from amrita_core.types import MemoryModel
@@ -15,9 +20,11 @@ from amrita_core.types import MemoryModel
 from .tools.manager import MultiToolsManager
 
 T = TypeVar("T")
+# Keeps MCP close tasks alive until done
+_closing_tasks: set[asyncio.Task[None]] = set()
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     """Container for all session-specific data.
 
@@ -47,14 +54,18 @@ class SessionsManager:
 
     _session2DataMap: dict[str, SessionData]
     _instance = None
+    _lock = threading.Lock()
     __marker = object()
 
     def __new__(cls) -> Self:
         """Implement singleton pattern, create new instance if none exists, otherwise return existing"""
-        if cls._instance is None:
-            cls._session2DataMap = {}
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        if (instance := cls._instance) is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._session2DataMap = {}
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
     def is_session_registered(self, session_id: str) -> bool:
         """Check if a session is registered.
@@ -67,14 +78,14 @@ class SessionsManager:
         """
         return session_id in self._session2DataMap
 
-    def get_registered_sessions(self) -> dict[str, SessionData]:
+    def get_registered_sessions(self) -> Mapping[str, SessionData]:
         """
         Get all registered sessions.
 
         Returns:
-            dict[str, SessionData]: A copy of the registered sessions mapping to prevent external modification
+            Mapping[str, SessionData]: A read-only view of the registered sessions (writes raise `TypeError`), use `dict(...)` for a snapshot
         """
-        return self._session2DataMap.copy()
+        return MappingProxyType(self._session2DataMap)
 
     def init_session(self, session_id: str):
         """Initialize resources for a given session.
@@ -82,7 +93,7 @@ class SessionsManager:
         Args:
             session_id (str): The unique identifier for the session
         """
-        if session_id not in self._session2DataMap:
+        if self._session2DataMap.get(session_id) is None:
             self._session2DataMap[session_id] = SessionData(
                 session_id,
                 MemoryModel(),
@@ -120,8 +131,9 @@ class SessionsManager:
         Raises:
             KeyError: If session is not found and no default is provided
         """
-        if session_id in self._session2DataMap:
-            return self._session2DataMap[session_id]
+        data = self._session2DataMap.get(session_id, self.__marker)
+        if data is not self.__marker:
+            return data
         elif default is not self.__marker:
             return default
         else:
@@ -140,13 +152,49 @@ class SessionsManager:
     def drop_session(self, session_id: str) -> None:
         """Remove a session and clean up its associated resources.
 
+        The session's MCP connections are closed in a background task on the running
+        event loop. Without one they can't be closed here, use `adrop_session` instead.
+
+        Args:
+            session_id: The unique identifier for the session to remove
+        """
+        data = self._pop_session(session_id)
+        if data is None or not data.mcp.clients:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(
+                f"Session {session_id} was dropped outside an event loop, its MCP connections are left open. Use `adrop_session` instead."
+            )
+            return
+        task = loop.create_task(data.mcp.close_all())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+
+    async def adrop_session(self, session_id: str) -> None:
+        """Remove a session, clean up its associated resources and close its MCP connections.
+
         Args:
             session_id: The unique identifier for the session to remove
         """
-        self._session2DataMap.pop(session_id, None)
+        if (data := self._pop_session(session_id)) is not None:
+            await data.mcp.close_all()
+
+    def _pop_session(self, session_id: str) -> SessionData | None:
+        """Unregister a session and terminate its running chat objects"""
+        data = self._session2DataMap.pop(session_id, None)
         from .chatmanager import chat_manager
 
-        for obj in chat_manager.running_chat_object[session_id]:
+        # Pop the whole list at once, indexing the defaultdict would leave an empty entry behind
+        objs = chat_manager.running_chat_object.pop(session_id, ())
+        id2map = chat_manager.running_chat_object_id2map
+        for obj in objs:
+            id2map.pop(obj.stream_id, None)
             with contextlib.suppress(Exception):
                 obj.terminate()
-            chat_manager.running_chat_object_id2map.pop(obj.stream_id, None)
+        return data
+
+
+sessions_manager: SessionsManager = SessionsManager()
+"""Shared `SessionsManager` instance, use it instead of constructing the singleton"""
@@ -1,12 +1,39 @@
 import re
 from functools import lru_cache
+from itertools import islice
 from typing import Literal
 
 import jieba
 from typing_extensions import final
 
+_WORD_PATTERN = re.compile(r"\w+|[^\w\s]")  # Match words or punctuation
+
+_SMALL_TEXT_LIMIT = 512
+_MEDIUM_TEXT_LIMIT = 8192  # Longer texts are counted without caching
+
+
+@lru_cache(maxsize=16)
+def _get_tokenizer(
+    mode: Literal["word", "bpe", "char"],
+    truncate_mode: Literal["head", "tail", "middle"],
+    max_tokens: int = 2048,
+) -> "Tokenizer":
+    """Get a shared tokenizer, they hold no per-call state"""
+    return Tokenizer(max_tokens=max_tokens, mode=mode, truncate_mode=truncate_mode)
+
+
+def _count(
+    text: str,
+    mode: Literal["word", "bpe", "char"],
+    truncate_mode: Literal["head", "tail", "middle"],
+) -> int:
+    return _get_tokenizer(mode, truncate_mode).count_tokens(text=text)
+
+
+_count_small = lru_cache(maxsize=8192)(_count)
+_count_medium = lru_cache(maxsize=1024)(_count)
+
 
-@lru_cache(maxsize=2048)
 def hybrid_token_count(
     text: str,
     mode: Literal["word", "bpe", "char"] = "word",
@@ -23,7 +50,14 @@ def hybrid_token_count(
     Returns:
         int: Number of tokens
     """
-    return Tokenizer(mode=mode, truncate_mode=truncate_mode).count_tokens(text=text)
+    # Short texts repeat often and are cheap to hash, so they get the largest cache;
+    # very long texts would only evict useful entries
+    length = len(text)
+    if length <= _SMALL_TEXT_LIMIT:
+        return _count_small(text, mode, truncate_mode)
+    elif length <= _MEDIUM_TEXT_LIMIT:
+        return _count_medium(text, mode, truncate_mode)
+    return _count(text, mode, truncate_mode)
 
 
 @final
@@ -46,7 +80,6 @@ class Tokenizer:
         self.max_tokens = max_tokens
         self.mode = mode
         self.truncate_mode = truncate_mode
-        self._word_pattern = re.compile(r"\w+|[^\w\s]")  # Match words or punctuation
 
     def tokenize(self, text: str) -> list[str]:
         """Perform tokenization operation, returning a list of tokens
@@ -60,18 +93,25 @@ class Tokenizer:
         if self.mode == "char":
             return list(text)
 
-        # Mixed Chinese-English tokenization strategy
-        tokens = []
-        for chunk in re.findall(self._word_pattern, text):
-            if chunk.strip() == "":
-                continue
+        limited = self.mode == "word"
+        if text.isascii():
+            # Nothing for jieba to segment, let the regex engine do all the work;
+            # a lone word such as a name or ID is already its only token
+            tokens = [text] if text.isalnum() else _WORD_PATTERN.findall(text)
+            return tokens[: self.max_tokens] if limited else tokens
 
-            if self._is_english(chunk):
-                tokens.extend(chunk.split())
+        # Mixed Chinese-English tokenization strategy
+        tokens: list[str] = []
+        for match in _WORD_PATTERN.finditer(text):
+            chunk = match.group()
+            if chunk.isascii():
+                tokens.append(chunk)
             else:
-                tokens.extend(jieba.lcut(chunk))
+                tokens.extend(jieba.cut(chunk))
+            if limited and len(tokens) >= self.max_tokens:
+                break
 
-        return tokens[: self.max_tokens] if self.mode == "word" else tokens
+        return tokens[: self.max_tokens] if limited else tokens
 
     def truncate(self, tokens: list[str]) -> list[str]:
         """Perform token truncation operation
@@ -85,6 +125,7 @@ class Tokenizer:
         if len(tokens) <= self.max_tokens:
             return tokens
 
+        # A single slice is already the cheapest copy for head and tail modes
         if self.truncate_mode == "head":
             return tokens[-self.max_tokens :]
         elif self.truncate_mode == "tail":
@@ -92,7 +133,9 @@ class Tokenizer:
         else:  # middle mode preserves head and tail
             head_len = self.max_tokens // 2
             tail_len = self.max_tokens - head_len
-            return tokens[:head_len] + tokens[-tail_len:]
+            result = tokens[:head_len]
+            result.extend(islice(tokens, len(tokens) - tail_len, None))
+            return result
 
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in text
@@ -114,4 +157,4 @@ class Tokenizer:
         Returns:
             bool: Whether the text is English
         """
-        return all(ord(c) < 128 for c in text)
+        return text.isascii()
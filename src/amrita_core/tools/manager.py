@@ -1,9 +1,10 @@
 import inspect
 import re
+import threading
 import typing
 from asyncio import iscoroutinefunction
-from collections.abc import Awaitable, Callable
-from functools import wraps
+from collections.abc import Awaitable, Callable, Iterable
+from functools import lru_cache, wraps
 from typing import Any, get_args, get_origin, get_type_hints, overload
 
 from typing_extensions import Self
@@ -16,20 +17,82 @@ from .models import (
     ToolContext,
     ToolData,
     ToolFunctionSchema,
+    always_enabled,
 )
 
 T = typing.TypeVar("T")
 
+_ARGS_HEADER_RE = re.compile(r"^\s*(?:args|参数):.*$", re.IGNORECASE | re.MULTILINE)
+_PARAM_RE = re.compile(
+    r"^[^\S\n]*([a-zA-Z_][a-zA-Z0-9_]*)[^\S\n]*(?:\(([^)\n]+)\))?[^\S\n]*:(.*)$",
+    re.MULTILINE,
+)
+_LINE_BREAK_RE = re.compile(r"\s*\n\s*")
+
+
+def _copy_dump(value: Any) -> Any:
+    # Dumps only nest dicts and lists, a plain rebuild beats deepcopy by ~3x
+    if isinstance(value, dict):
+        return {k: _copy_dump(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_dump(v) for v in value]
+    return value
+
 
 class MultiToolsManager:
     _models: dict[str, ToolData]
-    _disabled_tools: set[
+    _disabled_tools: frozenset[
         str
-    ]  # Disabled tools, has_tool and get_tool will not return disabled tools
+    ]  # Disabled tools, has_tool and get_tool will not return disabled tools. Replaced rather than mutated so readers need no lock
+    _disabled_lock: threading.Lock  # Serializes writers of _disabled_tools
+    _version: int  # Bumped whenever tools are registered, removed, enabled or disabled
+    _snapshot: tuple[
+        int, dict[str, ToolData], frozenset[str], dict[str, ToolData], bool
+    ]
+    _meta_dict_cache: dict[frozenset[tuple[str, Any]], dict[str, dict[str, Any]]]
 
     def __init__(self):
         self._models = {}
-        self._disabled_tools = set()
+        self._disabled_tools = frozenset()
+        self._disabled_lock = threading.Lock()
+        self._version = 0
+        self._snapshot = (-1, self._models, self._disabled_tools, {}, False)
+        self._meta_dict_cache = {}
+
+    def _enabled_tools(self) -> tuple[dict[str, ToolData], bool]:
+        """Get the tools that are not disabled, rebuilt only after they change
+
+        Returns:
+            tuple[dict[str, ToolData], bool]: The tools, and whether any of them has a custom `enable_if`
+        """
+        version, models, disabled, tools, dynamic = self._snapshot
+        if (
+            version != self._version
+            or models is not self._models
+            or disabled is not self._disabled_tools
+        ):
+            # Filter in insertion order so tools are always listed the same way
+            tools = (
+                {
+                    name: data
+                    for name, data in self._models.items()
+                    if name not in self._disabled_tools
+                }
+                if self._disabled_tools
+                else self._models.copy()
+            )
+            dynamic = any(
+                data.enable_if is not always_enabled for data in tools.values()
+            )
+            self._snapshot = (
+                self._version,
+                self._models,
+                self._disabled_tools,
+                tools,
+                dynamic,
+            )
+            self._meta_dict_cache.clear()
+        return tools, dynamic
 
     def has_tool(self, name: str) -> bool:
         return False if name in self._disabled_tools else name in self._models
@@ -39,9 +102,9 @@ class MultiToolsManager:
     @overload
     def get_tool(self, name: str, default: T) -> ToolData | T: ...
     def get_tool(self, name: str, default: T = None) -> ToolData | T | None:
-        if not self.has_tool(name):
+        tool = self._models.get(name)
+        if tool is None or name in self._disabled_tools:
             return default
-        tool: ToolData = self._models[name]
         return tool if tool.enable_if() else default
 
     @overload
@@ -52,11 +115,7 @@ class MultiToolsManager:
         self, name: str, default: T | None = None
     ) -> ToolFunctionSchema | None | T:
         func_data = self.get_tool(name)
-        if func_data is None:
-            return default
-        if isinstance(func_data, ToolData):
-            return func_data.data
-        return default
+        return default if func_data is None else func_data.data
 
     @overload
     def get_tool_func(
@@ -84,55 +143,97 @@ class MultiToolsManager:
         | T
     ):
         func_data = self.get_tool(name)
-        if func_data is None:
-            return default
-        if isinstance(func_data, ToolData):
-            return func_data.func
-        return default
+        return default if func_data is None else func_data.func
 
     def get_tools(self) -> dict[str, ToolData]:
+        tools, dynamic = self._enabled_tools()
+        if not dynamic:
+            return tools.copy()
         return {
             name: data
-            for name, data in self._models.items()
-            if (name not in self._disabled_tools and data.enable_if())
+            for name, data in tools.items()
+            if data.enable_if is always_enabled or data.enable_if()
         }
 
     def tools_meta(self) -> dict[str, ToolFunctionSchema]:
-        return {
-            k: v.data
-            for k, v in self._models.items()
-            if (k not in self._disabled_tools and v.enable_if())
-        }
+        return {k: v.data for k, v in self.get_tools().items()}
 
     def tools_meta_dict(self, **kwargs) -> dict[str, dict[str, Any]]:
+        """Get the `model_dump` of every enabled tool's schema
+
+        Dumps are cached per set of dump options, every call returns its own
+        copies, so callers may modify the result freely.
+
+        Args:
+            **kwargs: Options passed to `model_dump`
+
+        Returns:
+            dict[str, dict[str, Any]]: Tool name to dumped schema
+        """
+        tools, dynamic = self._enabled_tools()
+        try:
+            key = frozenset(kwargs.items())
+        except TypeError:  # Unhashable dump options, skip the cache
+            return {
+                k: v.data.model_dump(**kwargs)
+                for k, v in tools.items()
+                if v.enable_if is always_enabled or v.enable_if()
+            }
+        if (dumps := self._meta_dict_cache.get(key)) is None:
+            dumps = {k: v.data.model_dump(**kwargs) for k, v in tools.items()}
+            self._meta_dict_cache[key] = dumps
         return {
-            k: v.data.model_dump(**kwargs)
-            for k, v in self._models.items()
-            if (k not in self._disabled_tools and v.enable_if())
+            k: _copy_dump(dumps[k])
+            for k, v in tools.items()
+            if not dynamic or v.enable_if is always_enabled or v.enable_if()
         }
 
     def register_tool(self, tool: ToolData) -> None:
         if tool.data.function.name not in self._models:
             self._models[tool.data.function.name] = tool
+            self._version += 1
         else:
             raise ValueError(f"Tool {tool.data.function.name} already exists")
 
+    def register_tools(self, tools: Iterable[ToolData]) -> None:
+        """Register several tools at once, either all of them or none
+
+        Args:
+            tools (Iterable[ToolData]): Tools to register
+
+        Raises:
+            ValueError: If a tool name is already registered or repeated in `tools`
+        """
+        batch: dict[str, ToolData] = {}
+        for tool in tools:
+            name = tool.data.function.name
+            if name in self._models or name in batch:
+                raise ValueError(f"Tool {name} already exists")
+            batch[name] = tool
+        if batch:
+            self._models.update(batch)
+            self._version += 1
+
     def remove_tool(self, name: str) -> None:
         self._models.pop(name, None)
-        if name in self._disabled_tools:
-            self._disabled_tools.remove(name)
+        with self._disabled_lock:
+            if name in self._disabled_tools:
+                self._disabled_tools = frozenset(self._disabled_tools - {name})
+        self._version += 1
 
     def enable_tool(self, name: str) -> None:
-        if name in self._disabled_tools:
-            self._disabled_tools.remove(name)
-        else:
-            raise ValueError(f"Tool {name} is not disabled")
+        with self._disabled_lock:
+            if name not in self._disabled_tools:
+                raise ValueError(f"Tool {name} is not disabled")
+            self._disabled_tools = frozenset(self._disabled_tools - {name})
+        self._version += 1
 
     def disable_tool(self, name: str) -> None:
-        if self.has_tool(name):
-            self._disabled_tools.add(name)
-        else:
-            raise ValueError(f"Tool {name} does not exist or has been disabled")
+        with self._disabled_lock:
+            if not self.has_tool(name):
+                raise ValueError(f"Tool {name} does not exist or has been disabled")
+            self._disabled_tools = frozenset(self._disabled_tools | {name})
+        self._version += 1
 
     def get_disabled_tools(self) -> list[str]:
         return list(self._disabled_tools)
@@ -141,18 +242,26 @@ class MultiToolsManager:
 class ToolsManager(MultiToolsManager):
     _instance = None
     _initialized = False
+    _lock = threading.Lock()
 
     def __new__(cls) -> Self:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        if (instance := cls._instance) is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
     def __init__(self) -> None:
-        if not self.__class__._initialized:
-            super().__init__()
-            self.__class__._initialized = True
+        if self.__class__._initialized:
+            return
+        with self._lock:
+            if not self.__class__._initialized:
+                super().__init__()
+                self.__class__._initialized = True
 
 
+@lru_cache(maxsize=256)
 def _parse_google_docstring(docstring: str | None) -> tuple[str, dict[str, str]]:
     """
     Parse Google-style docstring to extract function description and parameter descriptions.Yes, just like this function's doc.
@@ -161,38 +270,22 @@ def _parse_google_docstring(docstring: str | None) -> tuple[str, dict[str, str]]
         docstring: The docstring to parse
 
     Returns:
-        A tuple containing (function_description, parameter_descriptions_dict)
+        A tuple containing (function_description, parameter_descriptions_dict), shared between calls so do not modify it
     """
     if not docstring:
         return "(no description provided for this tool)", {}
 
-    lines = [line.strip() for line in docstring.split("\n") if line.strip()]
-    args_start_idx = -1
-    for i, line in enumerate(lines):
-        if line.lower().startswith("args:") or line.lower().startswith("参数:"):
-            args_start_idx = i
-            break
-    if args_start_idx != -1:
-        func_desc_lines: list[str] = lines[:args_start_idx]
-        func_desc: str = " ".join(func_desc_lines).strip()
-        args_lines: list[str] = lines[args_start_idx + 1 :]
+    if header := _ARGS_HEADER_RE.search(docstring):
+        desc_text, args_text = docstring[: header.start()], docstring[header.end() :]
     else:
-        func_desc = " ".join(lines).strip()
-        args_lines = []
+        desc_text, args_text = docstring, ""
+    func_desc = _LINE_BREAK_RE.sub(" ", desc_text.strip())
 
     param_descriptions = {}
-    param_pattern = r"^([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\(([^)]+)\))?\s*:\s*(.*)"
-
-    for line in args_lines:
-        match = re.match(param_pattern, line)
-        if match:
-            param_name = match.group(1)
-            param_desc = match.group(3).strip()
-
-            if param_desc:
-                param_descriptions[param_name] = param_desc
-            else:
-                param_descriptions[param_name] = f"Parameter {param_name}"
+    for match in _PARAM_RE.finditer(args_text):
+        param_name = match.group(1)
+        param_desc = match.group(3).strip()
+        param_descriptions[param_name] = param_desc or f"Parameter {param_name}"
 
     if not func_desc:
         func_desc = "(no description provided for this tool)"
@@ -274,22 +367,20 @@ def simple_tool(func: Callable[..., Any | Awaitable[Any]]):
         name=func.__name__, description=func_desc, parameters=parameters_schema
     )
 
-    @on_tools(function_def, strict=True)
-    @wraps(func)
-    async def tool_wrapper(params: dict[str, Any]) -> str:
-        bound_args: inspect.BoundArguments = signature.bind(**params)
-        bound_args.apply_defaults()
+    # Calling with keyword arguments applies defaults and rejects missing or
+    # unexpected parameters just like `signature.bind`, without the per-call cost
+    if iscoroutinefunction(func):
 
-        result = (
-            await func(**bound_args.arguments)
-            if iscoroutinefunction(func)
-            else func(**bound_args.arguments)
-        )
+        async def tool_wrapper(params: dict[str, Any]) -> str:
+            # Convert result to string as expected by the schema
+            return str(await func(**params))
+
+    else:
 
-        # Convert result to string as expected by the schema
-        return str(result)
+        async def tool_wrapper(params: dict[str, Any]) -> str:
+            return str(func(**params))
 
-    return tool_wrapper
+    return on_tools(function_def, strict=True)(wraps(func)(tool_wrapper))
 
 
 def _python_type_to_json_type(python_type: type[Any]) -> JSON_OBJECT_TYPE:
@@ -314,7 +405,7 @@ def on_tools(
     data: FunctionDefinitionSchema,
     custom_run: bool = False,
     strict: bool = False,
-    enable_if: Callable[[], bool] = lambda: True,
+    enable_if: Callable[[], bool] = always_enabled,
 ) -> Callable[
     ...,
     Callable[[dict[str, Any]], Awaitable[str]]
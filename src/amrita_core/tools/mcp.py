@@ -1,14 +1,26 @@
+import asyncio
+import contextlib
+import itertools
 import json
-import random
+import threading
 from asyncio import Lock
-from collections.abc import Awaitable, Callable, Iterable
-from contextlib import nullcontext
-from copy import deepcopy
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from contextlib import asynccontextmanager, nullcontext
+from types import MappingProxyType
 from typing import Any, overload
 
 from fastmcp import Client
 from fastmcp.client.client import CallToolResult
 from fastmcp.client.transports.base import ClientTransportT
+from fastmcp.exceptions import ToolError
 from mcp.types import TextContent
 from typing_extensions import Self
 from zipp import Path
@@ -26,6 +38,8 @@ from .models import (
 )
 
 MCP_SERVER_SCRIPT_TYPE = ClientTransportT
+# `mcp.types.Tool` fields used by MCPToolSchema, under both the 1.x and 2.x field names
+_MCP_TOOL_FIELDS = frozenset({"name", "description", "inputSchema", "input_schema"})
 
 
 class NOT_GIVEN:
@@ -33,7 +47,11 @@ class NOT_GIVEN:
 
 
 class MCPClient:
-    """Reusable MCP Client"""
+    """Reusable MCP Client
+
+    The connection is opened on the first call and kept open across calls,
+    close it with `_close` or `MultiClientManager.close_all`.
+    """
 
     mcp_client: Client | None = None
     server_script: MCP_SERVER_SCRIPT_TYPE
@@ -42,14 +60,25 @@ class MCPClient:
         self,
         server_script: MCP_SERVER_SCRIPT_TYPE,
         # headers: dict | None = None,
+        max_concurrency: int = 8,
     ):
+        """
+        Args:
+            server_script (MCP_SERVER_SCRIPT_TYPE): MCP Server script path (or URI).
+            max_concurrency (int, optional): maximum in-flight tool calls on the connection. Defaults to 8.
+        """
         self.mcp_client = None
         self.server_script: MCP_SERVER_SCRIPT_TYPE = server_script
         self.tools: list[MCPToolSchema] = []
         self.openai_tools: list[ToolFunctionSchema] = []
+        self._tools_fingerprint: int | None = None  # Fingerprint of the raw tool list
+        self._connect_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._leases: dict[int, int] = {}  # id(connection)->in-flight calls using it
 
     async def __aenter__(self) -> Self:
-        await self._connect()
+        # Reuse a connection opened by the manager or an earlier call
+        await self._ensure_connected()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -63,21 +92,57 @@ class MCPClient:
         """
 
         try:
-            if self.mcp_client is None:
-                await self._connect()
-            assert self.mcp_client is not None
-            response: CallToolResult = await self.mcp_client.call_tool(tool_name, data)
-            ct: list[TextContent] = [
-                i for i in response.content if isinstance(i, TextContent)
+            async with self._semaphore, self._lease() as client:
+                response: CallToolResult = await client.call_tool(tool_name, data)
+            texts: list[str] = [
+                i.text for i in response.content if isinstance(i, TextContent)
             ]
-            return "".join([f"{i.text}\n\n" for i in ct])
+            # Every text block is followed by a blank line
+            return "\n\n".join(texts) + "\n\n" if texts else ""
         except Exception as e:
             logger.opt(exception=e, colors=True).error(
                 f"Failed to call tool:{tool_name}, because {e}."
             )
             return json.dumps({"success": False, "error": str(e)})
+
+    async def _ensure_connected(self) -> Client:
+        """Get the persistent connection, connecting on first use"""
+        if self.mcp_client is None:
+            async with self._connect_lock:
+                if self.mcp_client is None:
+                    await self._connect()
+        assert self.mcp_client is not None
+        return self.mcp_client
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncGenerator[Client, None]:
+        """Use the persistent connection for one call
+
+        A connection that is replaced or closed while calls are using it is only
+        closed once the last of them finishes.
+        """
+        client = await self._ensure_connected()
+        key = id(client)
+        self._leases[key] = self._leases.get(key, 0) + 1
+        try:
+            yield client
+        except Exception as e:
+            if not isinstance(e, ToolError) and client is self.mcp_client:
+                # The connection may be broken, the next call reconnects
+                self.mcp_client = None
+            raise
         finally:
-            await self._close()
+            if count := self._leases.pop(key) - 1:
+                self._leases[key] = count
+            elif client is not self.mcp_client:
+                await client.__aexit__(None, None, None)
+
+    def _detach(self) -> Client | None:
+        """Unpublish the persistent connection, returning it if no call is using it"""
+        client, self.mcp_client = self.mcp_client, None
+        if client is not None and id(client) not in self._leases:
+            return client
+        return None
 
     async def _connect(self, update_tools: bool = False):
         """Connect to MCP Server
@@ -88,27 +153,40 @@ class MCPClient:
             raise RuntimeError("MCP Server is already connected!")
 
         server_script = self.server_script
-        self.mcp_client = Client(server_script)
-        await self.mcp_client.__aenter__()
+        client = Client(server_script)
+        await client.__aenter__()
+        # Only published once connected, concurrent callers may use it right away
+        self.mcp_client = client
         logger.info(f"Successfully connected to MCP Server@{server_script}")
         if not self.tools or update_tools:
-            self.tools = [
-                MCPToolSchema.model_validate(i.model_dump())
-                for i in await self.mcp_client.list_tools()
+            # Only dump the fields MCPToolSchema reads, by alias since newer `mcp`
+            # releases use snake_case field names
+            raw_tools = [
+                tool.model_dump(
+                    by_alias=True, exclude_none=True, include=_MCP_TOOL_FIELDS
+                )
+                for tool in await self.mcp_client.list_tools()
             ]
+            fingerprint = hash(json.dumps(raw_tools, sort_keys=True, default=str))
+            if fingerprint == self._tools_fingerprint:
+                # Unchanged since the last connection, keep the converted schemas
+                return
+            self.tools = [MCPToolSchema.model_validate(i) for i in raw_tools]
             logger.info(f"Available tools: {[tool.name for tool in self.tools]}")
             self._cast_tool_to_amrita()
+            self._tools_fingerprint = fingerprint
 
     def _format_tools_for_openai(self):
         """Convert MCP tool format to OpenAI tool format"""
+        # `self.tools` are validated MCP schemas, so the result is built without re-validation
         openai_tools: list[ToolFunctionSchema] = [
-            ToolFunctionSchema(
+            ToolFunctionSchema.model_construct(
                 strict=True,
                 type="function",
-                function=FunctionDefinitionSchema(
+                function=FunctionDefinitionSchema.model_construct(
                     name=tool.name,
                     description=tool.description or f"Running tool named: {tool.name}",
-                    parameters=FunctionParametersSchema(
+                    parameters=FunctionParametersSchema.model_construct(
                         type="object",
                         required=tool.inputSchema.required,
                         properties=cast_mcp_properties_to_amrita(
@@ -132,36 +210,97 @@ class MCPClient:
         """Get original MCP tool list"""
         return self.tools
 
+    async def _reconnect(self, update_tools: bool = False):
+        """Replace the persistent connection with a fresh one
+        Args:
+            update_tools (bool, optional): whether to update the tool list. Defaults to False.
+        """
+        async with self._connect_lock:
+            stale = self._detach()
+            await self._connect(update_tools)
+        if stale is not None:
+            await stale.__aexit__(None, None, None)
+
     async def _close(self):
-        """Close connection"""
-        if self.mcp_client:
-            await self.mcp_client.__aexit__(None, None, None)
-            self.mcp_client = None
+        """Close connection, in-flight calls finish on it before it is closed"""
+        async with self._connect_lock:
+            stale = self._detach()
+        if stale is not None:
+            await stale.__aexit__(None, None, None)
+
+
+class _ToolsRemapping(MutableMapping[str, str]):
+    """Tool name remapping (original_name->remapped_name) that keeps its reverse mapping in sync
+
+    Every write goes through `__setitem__`/`__delitem__`, so the mixin methods
+    (`setdefault`, `pop`, `popitem`, `update`, `|=`) can't bypass `inverse`.
+    """
+
+    __slots__ = ("_data", "inverse")
+
+    def __init__(self) -> None:
+        self._data: dict[str, str] = {}
+        self.inverse: dict[str, str] = {}  # remapped_name->original_name
+
+    def __getitem__(self, key: str) -> str:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if (old := self._data.get(key)) is not None:
+            self.inverse.pop(old, None)
+        self._data[key] = value
+        self.inverse[value] = key
+
+    def __delitem__(self, key: str) -> None:
+        self.inverse.pop(self._data.pop(key), None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __ior__(self, other: Mapping[str, str] | Iterable[tuple[str, str]]) -> Self:
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.inverse.clear()
+
+    def copy(self) -> dict[str, str]:
+        return self._data.copy()
 
 
 class MultiClientManager:
     clients: list[MCPClient]
     script_to_clients: dict[str, MCPClient]
     name_to_clients: dict[str, MCPClient]  # Map from FunctionName to MCPClient
-    tools_remapping: dict[
-        str, str
-    ]  # Remap duplicate tools for SuggarChat (original_name->remapped_name)
-    reversed_remappings: dict[
-        str, str
-    ]  # Reverse mapping (remapped_name->original_name)
+    tools_remapping: _ToolsRemapping  # Remap duplicate tools for SuggarChat (original_name->remapped_name)
     tools_manager: MultiToolsManager = ToolsManager()
     _lock: Lock
+    _remap_counter: itertools.count  # Suffix source for remapped tool names
     _is_initialized = False  # Whether ToolsMapping is ready
 
     def __init__(self, tools_manager: MultiToolsManager | None = None) -> None:
-        self._initted = True
         self.tools_manager = tools_manager or self.tools_manager
         self.clients = []
         self.name_to_clients = {}
-        self.tools_remapping = {}
-        self.reversed_remappings = {}
+        self.tools_remapping = _ToolsRemapping()
         self.script_to_clients = {}
         self._lock = Lock()
+        self._remap_counter = itertools.count(1)
+
+    @property
+    def reversed_remappings(self) -> Mapping[str, str]:
+        """Read-only reverse mapping (remapped_name->original_name) of `tools_remapping`"""
+        return MappingProxyType(self.tools_remapping.inverse)
 
     def get_client_by_script(self, server_script: MCP_SERVER_SCRIPT_TYPE) -> MCPClient:
         """Get MCP Client (without operating stored MCP Server)
@@ -175,13 +314,31 @@ class MultiClientManager:
         Args:
             tool_name (str): tool name
         """
-        async with self._lock:
-            name = self.tools_remapping.get(tool_name) or tool_name
-            if name in self.name_to_clients:
-                return self.name_to_clients[name]
-            raise RuntimeError(
-                f"Tool not found: {tool_name}{f' (remapped from `{name}`)' if name != tool_name else ''}"
-            )
+        # The lookup never awaits, so it only has to wait while a writer holds the lock
+        if self._lock.locked():
+            async with self._lock:
+                return self._lookup_client(tool_name)
+        return self._lookup_client(tool_name)
+
+    def _lookup_client(self, tool_name: str) -> MCPClient:
+        name = self.tools_remapping.get(tool_name) or tool_name
+        if (client := self.name_to_clients.get(name)) is not None:
+            return client
+        raise RuntimeError(
+            f"Tool not found: {tool_name}{f' (remapped from `{name}`)' if name != tool_name else ''}"
+        )
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[Self, None]:
+        """Keep MCP connections open while the context is active, closing them all on exit"""
+        try:
+            yield self
+        finally:
+            await self.close_all()
+
+    async def close_all(self) -> None:
+        """Close the persistent connections of all registered MCP Servers"""
+        await asyncio.gather(*(client._close() for client in self.clients))
 
     def _tools_wrapper(
         self, tool_name: str
@@ -192,6 +349,22 @@ class MultiClientManager:
 
         return tools_runner
 
+    async def call_many(self, calls: Iterable[tuple[str, dict[str, Any]]]) -> list[str]:
+        """Call several MCP tools concurrently
+        Args:
+            calls (Iterable[tuple[str, dict[str, Any]]]): (tool name, tool parameters) pairs
+
+        Returns:
+            list[str]: tool results, in the same order as `calls`
+
+        Raises:
+            RuntimeError: If any tool is not registered
+        """
+        # Calls to the same server share its persistent connection
+        return await asyncio.gather(
+            *(self._tools_wrapper(name)(data) for name, data in calls)
+        )
+
     @overload
     def register_only(self, *, client: MCPClient) -> Self:
         """Register MCP Server only, without initialization"""
@@ -219,6 +392,10 @@ class MultiClientManager:
         return self
 
     async def update_tools(self, client: MCPClient):
+        """Re-read the tool list of an MCP Server and register it again
+        Args:
+            client (MCPClient): client of the MCP Server
+        """
         tools = client.get_tools()
         async with self._lock:
             for tool in tools:
@@ -226,14 +403,13 @@ class MultiClientManager:
                 self.tools_manager.remove_tool(name)
                 self.name_to_clients.pop(name, None)
                 if remap := self.tools_remapping.pop(name, None):
-                    self.reversed_remappings.pop(remap, None)
-        await self._load_this(client)
+                    self.tools_manager.remove_tool(remap)
+        await self._load_this(client, lock=True, update_tools=True)
 
     async def initialize_scripts_all(
         self, scripts: Iterable[MCP_SERVER_SCRIPT_TYPE]
     ) -> Self:
-        for script in scripts:
-            await self.initialize_this(script)
+        await asyncio.gather(*(self.initialize_this(script) for script in scripts))
         return self
 
     async def initialize_this(
@@ -241,54 +417,91 @@ class MultiClientManager:
     ) -> Self:
         """Register and initialize single MCP Server"""
         client: MCPClient = self.get_client_by_script(server_script)
-        async with self._lock:
-            try:
-                await self._load_this(client)
-            except Exception as e:
-                logger.error(f"Failed to initialize MCP Server@{server_script}: {e}")
-                if fail_then_raise:
-                    raise
-            else:
-                self.clients.append(client)
+        try:
+            await self._load_this(client, lock=True)
+        except Exception as e:
+            logger.error(f"Failed to initialize MCP Server@{server_script}: {e}")
+            if fail_then_raise:
+                raise
+        else:
+            self.clients.append(client)
         return self
 
-    async def _load_this(self, client: MCPClient, fail_then_raise=True):
-        try:
-            tools_remapping_tmp = {}
-            reversed_remappings_tmp = {}
-            name_to_clients_tmp = {}
-            tm = self.tools_manager
-            async with client as c:
-                tools = deepcopy(c.get_tools())
-                for tool in tools:
-                    if (
-                        tool.function.name in self.tools_remapping
-                        or tool.function.name in self.name_to_clients
-                    ):
-                        logger.warning(
-                            f"{client}@{client.server_script} has a tool named {tool.function.name}, which is already registered, the old tool will be replaced."
-                        )
-                    name_to_clients_tmp[tool.function.name] = client
-                    origin_name = tool.function.name
-                    if tm.has_tool(tool.function.name):
-                        remapped_name = (
-                            f"referred_{random.randint(1, 100)}_{tool.function.name}"
-                        )
-                        logger.warning(
-                            f"Tool already exists: {tool.function.name}, it will be remapped to: {remapped_name}"
-                        )
-                        tools_remapping_tmp[origin_name] = remapped_name
-                        reversed_remappings_tmp[remapped_name] = origin_name
-                        tool.function.name = remapped_name
-
-                    tm.register_tool(
-                        ToolData(
-                            data=tool,
-                            func=self._tools_wrapper(origin_name),
-                        )
-                    )
+    def _register_tools(self, client: MCPClient, tools: list[ToolFunctionSchema]):
+        """Register the tools of a connected client.
 
+        This never awaits, so it runs atomically with respect to other coroutines
+        even while servers are being loaded concurrently.
+        """
+        tools_remapping_tmp = {}
+        name_to_clients_tmp = {}
+        to_register: list[ToolData] = []
+        tm = self.tools_manager
+        for tool in tools:
+            if (
+                tool.function.name in self.tools_remapping
+                or tool.function.name in self.name_to_clients
+            ):
+                logger.warning(
+                    f"{client}@{client.server_script} has a tool named {tool.function.name}, which is already registered, the old tool will be replaced."
+                )
+            name_to_clients_tmp[tool.function.name] = client
+            origin_name = tool.function.name
+            if tm.has_tool(tool.function.name):
+                remapped_name = self._next_remapped_name(origin_name)
+                logger.warning(
+                    f"Tool already exists: {tool.function.name}, it will be remapped to: {remapped_name}"
+                )
+                tools_remapping_tmp[origin_name] = remapped_name
+                # Only renamed tools are copied, the client keeps the original names
+                tool = tool.model_copy(deep=True)
+                tool.function.name = remapped_name
+
+            to_register.append(
+                ToolData(
+                    data=tool,
+                    func=self._tools_wrapper(origin_name),
+                )
+            )
+        tm.register_tools(to_register)
+        self.tools_remapping.update(tools_remapping_tmp)
+        self.name_to_clients.update(name_to_clients_tmp)
+
+    def _next_remapped_name(self, name: str) -> str:
+        """Get a remapped name for `name` that no registered tool is using"""
+        tm = self.tools_manager
+        while True:
+            remapped_name = f"referred_{next(self._remap_counter)}_{name}"
+            if (
+                not tm.has_tool(remapped_name)
+                and remapped_name not in self.tools_remapping.inverse
+            ):
+                return remapped_name
+
+    async def _load_this(
+        self,
+        client: MCPClient,
+        fail_then_raise=True,
+        lock: bool = False,
+        update_tools: bool = False,
+    ):
+        """Load the tools of an MCP Server
+        Args:
+            client (MCPClient): client of the MCP Server
+            fail_then_raise (bool, optional): whether to raise on failure instead of logging. Defaults to True.
+            lock (bool, optional): whether to take the manager lock to register the tools. Defaults to False.
+            update_tools (bool, optional): whether to re-read a tool list the client already has. Defaults to False.
+        """
+        try:
+            # The connection is made without the lock, so servers load concurrently
+            # and tool lookups are not blocked by network I/O. In-flight calls keep
+            # the old connection until they finish, the new one is kept for later calls
+            await client._reconnect(update_tools)
+            tools = client.get_tools()
+            async with self._lock if lock else nullcontext():
+                self._register_tools(client, tools)
         except Exception as e:
+            await client._close()
             if fail_then_raise:
                 raise
             logger.opt(exception=e, colors=True).error(
@@ -296,26 +509,24 @@ class MultiClientManager:
             )
         else:
             logger.info(f"Successfully loaded MCP Server@{client.server_script}")
-            self.tools_remapping.update(tools_remapping_tmp)
-            self.reversed_remappings.update(reversed_remappings_tmp)
-            self.name_to_clients.update(name_to_clients_tmp)
             if isinstance(client.server_script, str | Path):
                 server_script = str(client.server_script)
                 self.script_to_clients[server_script] = client
 
     async def reinitalize_all(self):
         async with self._lock:
-            for client in deepcopy(self.clients):
+            for client in list(self.clients):
                 await self.unregister_client(client.server_script, False)
                 self.register_only(client=client)
                 await self._load_this(client, fail_then_raise=False)
 
     async def initialize_all(self, lock: bool = True):
         """Connect to all MCP Servers"""
-        async with self._lock if lock else nullcontext():
-            for client in self.clients:
-                await self._load_this(client, False)
-            self._is_initialized = True
+        # The lock is only held while each server's tools are registered
+        await asyncio.gather(
+            *(self._load_this(client, False, lock=lock) for client in self.clients)
+        )
+        self._is_initialized = True
 
     async def unregister_client(self, script_name: str | Path, lock: bool = True):
         """Unregister an MCP Server"""
@@ -324,29 +535,39 @@ class MultiClientManager:
             script_name = str(script_name)
             if script_name in self.script_to_clients:
                 client = self.script_to_clients.pop(script_name)
+                await client._close()
                 for tool in client.openai_tools:
                     name = tool.function.name
                     tools_manager.remove_tool(name)
                     self.name_to_clients.pop(name, None)
                     if remap := self.tools_remapping.pop(name, None):
                         tools_manager.remove_tool(remap)
-                        self.reversed_remappings.pop(remap, None)
-                for idx, client in enumerate(self.clients):
-                    if client.server_script == script_name:
-                        self.clients.pop(idx)
-                        break
+                # Remove by identity, `server_script` may be a Path rather than `script_name`
+                with contextlib.suppress(ValueError):
+                    self.clients.remove(client)
 
 
 class ClientManager(MultiClientManager):
     _instance = None
     _initialized = False
+    _instance_lock = threading.Lock()  # `_lock` is the manager's asyncio lock
 
     def __new__(cls) -> Self:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        if (instance := cls._instance) is not None:
+            return instance
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
     def __init__(self) -> None:
-        if not self.__class__._initialized:
-            super().__init__()
-            self.__class__._initialized = True
+        if self.__class__._initialized:
+            return
+        with self._instance_lock:
+            if not self.__class__._initialized:
+                super().__init__()
+                self.__class__._initialized = True
+
+
+client_manager: ClientManager = ClientManager()
+"""Shared `ClientManager` instance, use it instead of constructing the singleton"""
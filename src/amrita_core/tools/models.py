@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Generic, Literal, TypeVar
 
 from pydantic import BaseModel, Field, model_validator
@@ -49,61 +49,70 @@ def cast_mcp_properties_to_amrita(
 ) -> dict[str, FunctionPropertySchema]:
     """
     Convert MCPPropertySchemaObject dictionary to FunctionPropertySchema objects
+
+    Converted properties are cached by their JSON form and shared between calls,
+    so the returned schemas must be treated as read-only.
     """
     properties_dict: dict[str, FunctionPropertySchema] = {}
 
-    for key, prop in deepcopy(property).items():
+    # Every property is rebuilt as a new schema, so the input is never mutated
+    for key, prop in property.items():
         # Convert MCP property type to corresponding FunctionPropertySchema
-        converted_prop = _convert_single_property(prop)
+        converted_prop = _convert_property_cached(type(prop), prop.model_dump_json())
         properties_dict[key] = converted_prop
 
     return properties_dict
 
 
+@lru_cache(maxsize=256)
+def _convert_property_cached(
+    prop_type: type[MCP_OBJECT_TYPE], schema_json: str
+) -> FunctionPropertySchema:
+    # Tools across servers and reconnects mostly repeat the same property schemas
+    return _convert_single_property(prop_type.model_validate_json(schema_json))
+
+
 def _convert_single_property(mcp_prop: MCP_OBJECT_TYPE) -> FunctionPropertySchema:
     """
     Convert a single MCP_PROPERTY to FunctionPropertySchema
     """
-    # Get basic attributes
-    description = getattr(
-        mcp_prop,
-        "description",
-        "No description",
-    )
-    prop_type: JSON_OBJECT_TYPE = mcp_prop.type
+    # For numeric, string and boolean types only the base fields are kept,
+    # since FunctionPropertySchema doesn't include minimum/maximum fields
+    converter = _PROPERTY_CONVERTERS.get(type(mcp_prop), _base_property_params)
+    # The source was validated as an MCP schema already, skip re-validating it
+    return FunctionPropertySchema.model_construct(**converter(mcp_prop))
+
+
+def _base_property_params(mcp_prop: MCP_OBJECT_TYPE) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "type": mcp_prop.type,
+        "description": mcp_prop.description,
+    }
+    if mcp_prop.enum is not None:
+        params["enum"] = mcp_prop.enum
+    return params
+
 
-    # Prepare base parameters
-    base_params = {
-        "type": prop_type,
-        "description": description,
+def _object_property_params(mcp_prop: MCPPropertySchemaObject) -> dict[str, Any]:
+    params = _base_property_params(mcp_prop)
+    # Object type requires recursive conversion of its properties
+    params["properties"] = {
+        key: _convert_single_property(sub_prop)
+        for key, sub_prop in mcp_prop.properties.items()
     }
+    params["required"] = mcp_prop.required
+    return params
+
 
-    # If there are enum values, add to parameters
-    if hasattr(mcp_prop, "enum") and mcp_prop.enum is not None:
-        base_params["enum"] = mcp_prop.enum
-
-    if isinstance(mcp_prop, MCPPropertySchemaObject):
-        # Object type requires recursive conversion of its properties
-        if hasattr(mcp_prop, "properties") and mcp_prop.properties:
-            obj_properties = {}
-            for key, sub_prop in mcp_prop.properties.items():
-                obj_properties[key] = _convert_single_property(sub_prop)
-            base_params["properties"] = obj_properties
-        if hasattr(mcp_prop, "required") and mcp_prop.required:
-            base_params["required"] = mcp_prop.required
-
-    elif isinstance(mcp_prop, MCPPropertySchemaArray):
-        if hasattr(mcp_prop, "items"):
-            base_params["items"] = _convert_single_property(mcp_prop.items)
-        if hasattr(mcp_prop, "minItems") and mcp_prop.minItems > 0:
-            base_params["minItems"] = mcp_prop.minItems
-        if hasattr(mcp_prop, "maxItems") and mcp_prop.maxItems < 100:
-            base_params["maxItems"] = mcp_prop.maxItems
-        if hasattr(mcp_prop, "uniqueItems"):
-            base_params["uniqueItems"] = mcp_prop.uniqueItems
-
-    # For numeric and boolean types, no additional fields are needed since FunctionPropertySchema doesn't include minimum/maximum fields
-    return FunctionPropertySchema(**base_params)
+def _array_property_params(mcp_prop: MCPPropertySchemaArray) -> dict[str, Any]:
+    params = _base_property_params(mcp_prop)
+    params["items"] = _convert_single_property(mcp_prop.items)
+    if mcp_prop.minItems > 0:
+        params["minItems"] = mcp_prop.minItems
+    if mcp_prop.maxItems < 100:
+        params["maxItems"] = mcp_prop.maxItems
+    params["uniqueItems"] = mcp_prop.uniqueItems
+    return params
 
 
 class MCPPropertySchema(BaseModel, Generic[JOT_T]):
@@ -209,6 +218,12 @@ MCP_OBJECT_TYPE = (
     | MCPPropertySchemaBoolean
 )
 
+# Dispatch on the exact property class, other types only use the base fields
+_PROPERTY_CONVERTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    MCPPropertySchemaObject: _object_property_params,
+    MCPPropertySchemaArray: _array_property_params,
+}
+
 
 class MCPToolSchema(BaseModel):
     """Define the structure of MCP tools"""
@@ -335,6 +350,11 @@ class ToolContext:
     matcher: Matcher = field()
 
 
+def always_enabled() -> bool:
+    """Default `ToolData.enable_if`, managers may skip calling it"""
+    return True
+
+
 class ToolData(BaseModel):
     """Data model for registering Tools"""
 
@@ -348,6 +368,6 @@ class ToolData(BaseModel):
         description="Whether to customize execution; if enabled, passes Context class instead of dict and does not enforce return value.",
     )
     enable_if: Callable[[], bool] = Field(
-        default=lambda: True,
+        default=always_enabled,
         description="Whether to enable this tool",
     )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import TypeVar
 
@@ -7,6 +8,8 @@ import pytz
 
 T = TypeVar("T")
 
+_ASIA_SHANGHAI = pytz.timezone("Asia/Shanghai")
+
 
 def remove_think_tag(text: str) -> str:
     """Remove the first occurrence of think tag
@@ -18,21 +21,13 @@ def remove_think_tag(text: str) -> str:
         str: Processed text
     """
 
-    start_tag = "<think>"
-    end_tag = "</think>"
-    start_idx = text.find(start_tag)
-    if start_idx == -1:
+    head, sep, rest = text.partition("<think>")
+    if not sep:
         return text
-    end_idx = text.find(end_tag, start_idx + len(start_tag))
-    if end_idx == -1:
+    _, sep, tail = rest.partition("</think>")
+    if not sep:
         return text
-
-    end_of_end_tag = end_idx + len(end_tag)
-
-    text_new = text[:start_idx] + text[end_of_end_tag:]
-    while text_new.startswith("\n"):
-        text_new = text_new[1:]
-    return text_new
+    return (head + tail).lstrip("\n")
 
 
 def split_list(lst: list[T], threshold: int) -> list[list[T]]:
@@ -42,12 +37,19 @@ def split_list(lst: list[T], threshold: int) -> list[list[T]]:
     return [lst[i : i + threshold] for i in range(0, len(lst), threshold)]
 
 
+def split_list_view(lst: Sequence[T], threshold: int) -> Iterator[Iterator[T]]:
+    """Lazily split a sequence into chunks of at most `threshold` items
+
+    Unlike `split_list`, no sublists are copied, each chunk is a single-pass
+    iterator over `lst`. Use `split_list` when the chunks must be materialised.
+    """
+    size = len(lst)
+    for i in range(0, size, threshold):
+        # Index directly so every chunk starts in O(1) and can be consumed in any order
+        yield map(lst.__getitem__, range(i, min(i + threshold, size)))
+
+
 def get_current_datetime_timestamp(utc_time: None | datetime = None):
     """Get current time and format as date, weekday and time string"""
     utc_time = utc_time or datetime.now(pytz.utc)
-    asia_shanghai = pytz.timezone("Asia/Shanghai")
-    now = utc_time.astimezone(asia_shanghai)
-    formatted_date = now.strftime("%Y-%m-%d")
-    formatted_weekday = now.strftime("%A")
-    formatted_time = now.strftime("%H:%M:%S")
-    return f"[{formatted_date} {formatted_weekday} {formatted_time}]"
+    return utc_time.astimezone(_ASIA_SHANGHAI).strftime("[%Y-%m-%d %A %H:%M:%S]")
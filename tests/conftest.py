@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -8,6 +9,19 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+        """Run the session loop on uvloop when it is installed"""
+        return uvloop.EventLoopPolicy()
+
+
 def pytest_collection_modifyitems(items: list[pytest.Item]):
     pytest_asyncio_tests = (item for item in items if is_async_test(item))
     session_scope_marker = pytest.mark.asyncio(loop_scope="session")
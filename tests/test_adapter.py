@@ -1,10 +1,18 @@
 # type: ignore
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections import deque
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 from openai import AsyncStream
-from openai.types.chat.chat_completion import ChatCompletion
-from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from openai.types.chat.chat_completion import ChatCompletion, Choice
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+)
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
@@ -12,8 +20,9 @@ from openai.types.chat.chat_completion_message_tool_call import (
 from openai.types.chat.chat_completion_message_tool_call import (
     Function as ToolCallFunction,
 )
+from openai.types.completion_usage import CompletionUsage
 
-from amrita_core.builtins.adapter import OpenAIAdapter
+from amrita_core.builtins.adapter import OpenAIAdapter, _response_cache
 from amrita_core.config import AmritaConfig
 from amrita_core.tools.models import ToolFunctionSchema
 from amrita_core.types import ModelPreset, ToolCall, UniResponse
@@ -23,7 +32,7 @@ class MockAsyncStream(AsyncStream):
     """Mock AsyncStream for testing"""
 
     def __init__(self, chunks):
-        self.chunks = chunks
+        self.chunks = deque(chunks)
 
     def __aiter__(self):
         return self
@@ -31,384 +40,420 @@ class MockAsyncStream(AsyncStream):
     async def __anext__(self):
         if not self.chunks:
             raise StopAsyncIteration
-        return self.chunks.pop(0)
+        return self.chunks.popleft()
+
+
+_END_OF_STREAM = object()
+
+
+class QueueAsyncStream(AsyncStream):
+    """Stream fed by a producer through a queue, chunks arrive as they're put"""
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if (item := await self.queue.get()) is _END_OF_STREAM:
+            raise StopAsyncIteration
+        return item
+
+
+class FastAsyncMock(AsyncMock):
+    """AsyncMock without call history, only the await bookkeeping is kept
+
+    Tests count requests through `await_count` instead of `call_count`.
+    """
+
+    def _increment_mock_call(self, /, *args, **kwargs):
+        pass
+
+
+async def _collect(agen):
+    """Drain an async generator into a list"""
+    return [item async for item in agen]
+
+
+MOCK_MESSAGES = (
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": "Hello!"},
+)
+SPECIFIC_TOOL = ToolFunctionSchema(
+    function={
+        "name": "specific_function",
+        "description": "A test function",
+        "parameters": {"type": "object", "properties": {}},
+    }
+)
+USAGE = CompletionUsage.model_construct(
+    prompt_tokens=10, completion_tokens=5, total_tokens=15
+)
+# Fields every fake completion and chunk share, ChatCompletion doesn't mutate them
+ENVELOPE = {"id": "chatcmpl-123", "created": 1234567890, "model": "gpt-3.5-turbo"}
+
+
+@lru_cache
+def make_completion(
+    content: str | None,
+    *,
+    usage: bool = False,
+    tool_call: tuple[str, str, str] | None = None,
+) -> ChatCompletion:
+    """Build a completion once per payload, the adapter only reads it
+
+    The payloads are known to be valid, so every model is built with
+    `model_construct` and skips validation. `tool_call` is an
+    (id, function name, arguments) triple.
+    """
+    tool_calls = None
+    if tool_call is not None:
+        call_id, name, arguments = tool_call
+        tool_calls = [
+            ChatCompletionMessageToolCall.model_construct(
+                id=call_id,
+                function=ToolCallFunction.model_construct(
+                    name=name, arguments=arguments
+                ),
+                type="function",
+            )
+        ]
+    return ChatCompletion.model_construct(
+        **ENVELOPE,
+        choices=[
+            Choice.model_construct(
+                index=0,
+                message=ChatCompletionMessage.model_construct(
+                    role="assistant", content=content, tool_calls=tool_calls
+                ),
+                finish_reason="tool_calls" if tool_calls else "stop",
+            )
+        ],
+        object="chat.completion",
+        usage=USAGE if usage else None,
+    )
+
+
+@lru_cache
+def make_chunk(
+    content: str, finish_reason: str | None = None, *, usage: bool = False
+) -> ChatCompletionChunk:
+    """Build a stream chunk once per payload, the adapter only reads it"""
+    return ChatCompletionChunk.model_construct(
+        **ENVELOPE,
+        choices=[
+            ChunkChoice.model_construct(
+                index=0,
+                delta=ChoiceDelta.model_construct(content=content),
+                finish_reason=finish_reason,
+            )
+        ],
+        object="chat.completion.chunk",
+        usage=USAGE if usage else None,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_messages():
+    """Messages shared by the module, the adapter never modifies its input"""
+    return MOCK_MESSAGES
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    """Create OpenAIAdapter instance with mock config and preset, shared by the module"""
+    config = AmritaConfig()
+    preset = ModelPreset(
+        model="gpt-3.5-turbo",
+        base_url="https://api.openai.com/v1",
+        api_key="test-key",
+    )
+    return OpenAIAdapter(config=config, preset=preset)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def openai_client():
+    """Replace the OpenAI client class once for the whole module
+
+    The adapter is handed whatever client `openai_client.current` holds.
+    """
+    holder = SimpleNamespace(current=None)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "amrita_core.builtins.adapter.openai.AsyncOpenAI",
+            lambda **_: holder.current,
+        )
+        yield holder
+
+
+@pytest.fixture
+def mock_client(openai_client):
+    """Hand the adapter a fresh client per test
+
+    The adapter only touches `chat.completions.create`, so only that is a mock.
+    """
+    mock_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=FastAsyncMock()))
+    )
+    openai_client.current = mock_client
+    return mock_client
 
 
 class TestOpenAIAdapter:
     """Test OpenAIAdapter functionality"""
 
-    @pytest.fixture
-    def adapter(self):
-        """Create OpenAIAdapter instance with mock config and preset"""
-        config = AmritaConfig()
-        preset = ModelPreset(
-            model="gpt-3.5-turbo",
-            base_url="https://api.openai.com/v1",
-            api_key="test-key",
-        )
-        return OpenAIAdapter(config=config, preset=preset)
-
-    @pytest.fixture
-    def mock_messages(self):
-        """Create mock messages for testing"""
-        return [
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": "Hello!"},
-        ]
+    @pytest.fixture(autouse=True)
+    def reset_adapter(self, adapter):
+        """Undo the settings tests change on the shared adapter and its cache"""
+        yield
+        adapter.preset.config.stream = False
+        adapter.config.llm.response_cache_ttl = 0
+        # Also runs when an assertion fails, so no cached response leaks out
+        _response_cache.clear()
 
-    @pytest.mark.asyncio
     async def test_get_adapter_protocol(self):
         """Test get_adapter_protocol method"""
         protocol = OpenAIAdapter.get_adapter_protocol()
         assert protocol == ("openai", "__main__")
 
-    @pytest.mark.asyncio
-    async def test_call_api_non_streaming(self, adapter, mock_messages):
+    async def test_call_api_non_streaming(self, adapter, mock_messages, mock_client):
         """Test call_api with non-streaming response"""
         # Mock the OpenAI client response
-        mock_completion = ChatCompletion(
-            id="chatcmpl-123",
-            choices=[
-                {
-                    "index": 0,
-                    "message": {"role": "assistant", "content": "Hello there!"},
-                    "finish_reason": "stop",
-                }
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
-        )
+        mock_completion = make_completion("Hello there!", usage=True)
+
+        mock_client.chat.completions.create.return_value = mock_completion
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = mock_completion
-            mock_openai.return_value = mock_client
-
-            # Call the method
-            results = []
-            async for result in adapter.call_api(mock_messages):
-                results.append(result)
-
-            # Verify results
-            assert len(results) == 2  # content + UniResponse
-            assert results[0] == "Hello there!"
-            assert isinstance(results[1], UniResponse)
-            assert results[1].content == "Hello there!"
-            assert results[1].usage is not None
-            assert results[1].usage.prompt_tokens == 10
-
-    @pytest.mark.asyncio
-    async def test_call_api_streaming(self, adapter, mock_messages):
+        # Call the method
+        results = await _collect(adapter.call_api(mock_messages))
+
+        # Verify results
+        assert len(results) == 2  # content + UniResponse
+        assert results[0] == "Hello there!"
+        assert isinstance(results[1], UniResponse)
+        assert results[1].content == "Hello there!"
+        assert results[1].usage is not None
+        assert results[1].usage.prompt_tokens == 10
+
+    async def test_call_api_streaming(self, adapter, mock_messages, mock_client):
         """Test call_api with streaming response"""
         # Set stream to True
         adapter.preset.config.stream = True
 
         # Create mock chunks
-        chunk1 = ChatCompletionChunk(
-            id="chatcmpl-123",
-            choices=[
-                {"index": 0, "delta": {"content": "Hello"}, "finish_reason": None}
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion.chunk",
-        )
-        chunk2 = ChatCompletionChunk(
-            id="chatcmpl-123",
-            choices=[
-                {"index": 0, "delta": {"content": " there!"}, "finish_reason": "stop"}
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion.chunk",
-            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
-        )
-
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_stream = MockAsyncStream([chunk1, chunk2])
-            mock_client.chat.completions.create.return_value = mock_stream
-            mock_openai.return_value = mock_client
-
-            # Call the method
-            results = []
-            async for result in adapter.call_api(mock_messages):
-                results.append(result)
-
-            # Verify results
-            assert len(results) == 3  # "Hello" + " there!" + UniResponse
-            assert results[0] == "Hello"
-            assert results[1] == " there!"
-            assert isinstance(results[2], UniResponse)
-            assert results[2].content == "Hello there!"
-            assert results[2].usage is not None
-
-    @pytest.mark.asyncio
-    async def test_call_api_streaming_with_empty_content(self, adapter, mock_messages):
+        chunk1 = make_chunk("Hello")
+        chunk2 = make_chunk(" there!", "stop", usage=True)
+
+        mock_stream = MockAsyncStream([chunk1, chunk2])
+        mock_client.chat.completions.create.return_value = mock_stream
+
+        # Call the method
+        results = await _collect(adapter.call_api(mock_messages))
+
+        # Verify results
+        assert len(results) == 3  # "Hello" + " there!" + UniResponse
+        assert results[0] == "Hello"
+        assert results[1] == " there!"
+        assert isinstance(results[2], UniResponse)
+        assert results[2].content == "Hello there!"
+        assert results[2].usage is not None
+
+    async def test_call_api_streaming_from_producer(
+        self, adapter, mock_messages, mock_client
+    ):
+        """Test call_api consumes a stream while it is still being produced"""
+        adapter.preset.config.stream = True
+        # A single slot forces the producer to wait on the adapter for each chunk
+        queue = asyncio.Queue(maxsize=1)
+        mock_client.chat.completions.create.return_value = QueueAsyncStream(queue)
+        words = [f"w{i} " for i in range(50)]
+
+        async def produce():
+            for word in words:
+                await queue.put(make_chunk(word))
+            await queue.put(make_chunk("", "stop", usage=True))
+            await queue.put(_END_OF_STREAM)
+
+        producer = asyncio.create_task(produce())
+        results = await _collect(adapter.call_api(mock_messages))
+        await producer
+
+        assert results[:-2] == words
+        assert isinstance(results[-1], UniResponse)
+        assert results[-1].content == "".join(words)
+        assert results[-1].usage is not None
+
+    async def test_call_api_streaming_with_empty_content(
+        self, adapter, mock_messages, mock_client
+    ):
         """Test call_api with streaming response that has empty content chunks"""
         adapter.preset.config.stream = True
 
         # Create mock chunks with some empty content
-        chunk1 = ChatCompletionChunk(
-            id="chatcmpl-123",
-            choices=[{"index": 0, "delta": {"content": ""}, "finish_reason": None}],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion.chunk",
-        )
-        chunk2 = ChatCompletionChunk(
-            id="chatcmpl-123",
-            choices=[
-                {"index": 0, "delta": {"content": "Hello"}, "finish_reason": "stop"}
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion.chunk",
-        )
+        chunk1 = make_chunk("")
+        chunk2 = make_chunk("Hello", "stop")
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_stream = MockAsyncStream([chunk1, chunk2])
-            mock_client.chat.completions.create.return_value = mock_stream
-            mock_openai.return_value = mock_client
-
-            results = []
-            async for result in adapter.call_api(mock_messages):
-                results.append(result)
-
-            # Empty string is also yielded since it's not None
-            assert len(results) == 3
-            assert results[0] == ""
-            assert results[1] == "Hello"
-            assert isinstance(results[2], UniResponse)
-            assert results[2].content == "Hello"
-
-    @pytest.mark.asyncio
-    async def test_call_api_non_streaming_empty_content(self, adapter, mock_messages):
-        """Test call_api with non-streaming response that has empty content"""
-        mock_completion = ChatCompletion(
-            id="chatcmpl-123",
-            choices=[
-                {
-                    "index": 0,
-                    "message": {"role": "assistant", "content": None},
-                    "finish_reason": "stop",
-                }
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion",
-        )
+        mock_stream = MockAsyncStream([chunk1, chunk2])
+        mock_client.chat.completions.create.return_value = mock_stream
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = mock_completion
-            mock_openai.return_value = mock_client
-
-            results = []
-            async for result in adapter.call_api(mock_messages):
-                results.append(result)
-
-            assert len(results) == 2
-            assert results[0] == ""
-            assert isinstance(results[1], UniResponse)
-            assert results[1].content == ""
-
-    @pytest.mark.asyncio
-    async def test_call_tools_auto_choice(self, adapter, mock_messages):
-        """Test call_tools with auto tool choice"""
-        # Mock tool call response
-        mock_tool_call = ChatCompletionMessageToolCall(
-            id="call_123",
-            function=ToolCallFunction(
-                name="test_function", arguments='{"param": "value"}'
-            ),
-            type="function",
-        )
-        mock_completion = ChatCompletion(
-            id="chatcmpl-123",
-            choices=[
-                {
-                    "index": 0,
-                    "message": ChatCompletionMessage(
-                        role="assistant", content=None, tool_calls=[mock_tool_call]
-                    ),
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion",
-        )
+        results = await _collect(adapter.call_api(mock_messages))
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = mock_completion
-            mock_openai.return_value = mock_client
-
-            # Call the method
-            result = await adapter.call_tools(mock_messages, tools=[])
-
-            # Verify result
-            assert isinstance(result, UniResponse)
-            assert result.content is None
-            assert result.tool_calls is not None
-            assert len(result.tool_calls) == 1
-            assert isinstance(result.tool_calls[0], ToolCall)
-            assert result.tool_calls[0].id == "call_123"
-            assert result.tool_calls[0].function.name == "test_function"
-
-    @pytest.mark.asyncio
-    async def test_call_tools_specific_function_choice(self, adapter, mock_messages):
-        """Test call_tools with specific function tool choice"""
-        tool_schema = ToolFunctionSchema(
-            function={
-                "name": "specific_function",
-                "description": "A test function",
-                "parameters": {"type": "object", "properties": {}},
-            }
-        )
-        mock_tool_call = ChatCompletionMessageToolCall(
-            id="call_456",
-            function=ToolCallFunction(
-                name="specific_function", arguments='{"param": "test"}'
-            ),
-            type="function",
-        )
-        mock_completion = ChatCompletion(
-            id="chatcmpl-123",
-            choices=[
-                {
-                    "index": 0,
-                    "message": ChatCompletionMessage(
-                        role="assistant", content=None, tool_calls=[mock_tool_call]
-                    ),
-                    "finish_reason": "tool_calls",
-                }
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion",
-        )
+        # Empty string is also yielded since it's not None
+        assert len(results) == 3
+        assert results[0] == ""
+        assert results[1] == "Hello"
+        assert isinstance(results[2], UniResponse)
+        assert results[2].content == "Hello"
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = mock_completion
-            mock_openai.return_value = mock_client
+    async def test_call_api_non_streaming_empty_content(
+        self, adapter, mock_messages, mock_client
+    ):
+        """Test call_api with non-streaming response that has empty content"""
+        mock_completion = make_completion(None)
 
-            result = await adapter.call_tools(
-                mock_messages, tools=[], tool_choice=tool_schema
-            )
+        mock_client.chat.completions.create.return_value = mock_completion
 
-            assert isinstance(result, UniResponse)
-            assert result.tool_calls is not None
-            assert len(result.tool_calls) == 1
-            assert result.tool_calls[0].function.name == "specific_function"
-
-    @pytest.mark.asyncio
-    async def test_call_tools_no_tool_calls(self, adapter, mock_messages):
-        """Test call_tools when no tool calls are returned"""
-        mock_completion = ChatCompletion(
-            id="chatcmpl-123",
-            choices=[
-                {
-                    "index": 0,
-                    "message": ChatCompletionMessage(
-                        role="assistant", content="No tools needed", tool_calls=None
-                    ),
-                    "finish_reason": "stop",
-                }
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion",
-        )
+        results = await _collect(adapter.call_api(mock_messages))
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = mock_completion
-            mock_openai.return_value = mock_client
+        assert len(results) == 2
+        assert results[0] == ""
+        assert isinstance(results[1], UniResponse)
+        assert results[1].content == ""
 
-            result = await adapter.call_tools(mock_messages, tools=[])
+    @pytest.mark.parametrize(
+        ("tool_choice", "tool_call", "sent_choice"),
+        [
+            (
+                None,
+                ("call_123", "test_function", '{"param": "value"}'),
+                "auto",
+            ),
+            (
+                SPECIFIC_TOOL,
+                ("call_456", "specific_function", '{"param": "test"}'),
+                {"function": {"name": "specific_function"}, "type": "function"},
+            ),
+            (None, None, "auto"),
+            # A string is passed through as is
+            ("required", None, "required"),
+        ],
+        ids=["auto", "specific_function", "no_tool_calls", "string_choice"],
+    )
+    async def test_call_tools(
+        self, adapter, mock_messages, mock_client, tool_choice, tool_call, sent_choice
+    ):
+        """Test call_tools for each kind of tool choice"""
+        create = mock_client.chat.completions.create
+        create.return_value = make_completion(
+            None if tool_call else "No tools needed", tool_call=tool_call
+        )
 
-            assert isinstance(result, UniResponse)
-            assert result.content is None
-            assert result.tool_calls is None
+        result = await adapter.call_tools(
+            mock_messages, tools=[], tool_choice=tool_choice
+        )
 
-    @pytest.mark.asyncio
-    async def test_call_api_unexpected_response_type(self, adapter, mock_messages):
+        assert create.await_args.kwargs["tool_choice"] == sent_choice
+        assert isinstance(result, UniResponse)
+        assert result.content is None
+        if tool_call is None:
+            assert result.tool_calls is None
+            return
+        assert result.tool_calls is not None
+        assert len(result.tool_calls) == 1
+        assert isinstance(result.tool_calls[0], ToolCall)
+        assert result.tool_calls[0].id == tool_call[0]
+        assert result.tool_calls[0].function.name == tool_call[1]
+
+    async def test_call_api_unexpected_response_type(
+        self, adapter, mock_messages, mock_client
+    ):
         """Test call_api with unexpected response type"""
         adapter.preset.config.stream = False
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = "unexpected_string"
-            mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.return_value = "unexpected_string"
 
-            with pytest.raises(RuntimeError, match="Received unexpected response type"):
-                async for _ in adapter.call_api(mock_messages):
-                    pass
+        with pytest.raises(RuntimeError, match="Received unexpected response type"):
+            await _collect(adapter.call_api(mock_messages))
 
-    @pytest.mark.asyncio
-    async def test_call_api_streaming_index_error(self, adapter, mock_messages):
+    async def test_call_api_streaming_index_error(
+        self, adapter, mock_messages, mock_client
+    ):
         """Test call_api streaming with IndexError exception"""
         adapter.preset.config.stream = True
 
         # Create mock chunk that will cause IndexError (empty choices)
-        chunk1 = ChatCompletionChunk(
-            id="chatcmpl-123",
+        chunk1 = ChatCompletionChunk.model_construct(
+            **ENVELOPE,
             choices=[],  # Empty choices list will cause IndexError
-            created=1234567890,
-            model="gpt-3.5-turbo",
             object="chat.completion.chunk",
         )
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_stream = MockAsyncStream([chunk1])
-            mock_client.chat.completions.create.return_value = mock_stream
-            mock_openai.return_value = mock_client
-
-            results = []
-            async for result in adapter.call_api(mock_messages):
-                results.append(result)
-
-            # Should handle IndexError gracefully and return empty response
-            assert len(results) == 1  # Only UniResponse
-            assert isinstance(results[0], UniResponse)
-            assert results[0].content == ""
-
-    @pytest.mark.asyncio
-    async def test_call_tools_with_string_tool_choice(self, adapter, mock_messages):
-        """Test call_tools with string tool choice to cover client creation path"""
-        mock_completion = ChatCompletion(
-            id="chatcmpl-123",
-            choices=[
-                {
-                    "index": 0,
-                    "message": ChatCompletionMessage(
-                        role="assistant", content="No tools needed", tool_calls=None
-                    ),
-                    "finish_reason": "stop",
-                }
-            ],
-            created=1234567890,
-            model="gpt-3.5-turbo",
-            object="chat.completion",
+        mock_stream = MockAsyncStream([chunk1])
+        mock_client.chat.completions.create.return_value = mock_stream
+
+        results = await _collect(adapter.call_api(mock_messages))
+
+        # Should handle IndexError gracefully and return empty response
+        assert len(results) == 1  # Only UniResponse
+        assert isinstance(results[0], UniResponse)
+        assert results[0].content == ""
+
+    async def test_call_api_response_cache(
+        self, adapter, mock_messages, mock_client, monkeypatch
+    ):
+        """Test identical requests are answered from the response cache"""
+        adapter.config.llm.response_cache_ttl = 60
+        mock_completion = make_completion("Hello there!")
+
+        mock_client.chat.completions.create.return_value = mock_completion
+
+        first = await _collect(adapter.call_api(mock_messages))
+        second = await _collect(adapter.call_api(mock_messages))
+        assert mock_client.chat.completions.create.await_count == 1
+        assert second == first
+        assert second[1] is not first[1]
+
+        # A different conversation is a different request
+        other = [*mock_messages, {"role": "user", "content": "Again"}]
+        await _collect(adapter.call_api(other))
+        assert mock_client.chat.completions.create.await_count == 2
+
+        # Tool calls are cached too
+        await adapter.call_tools(mock_messages, tools=[])
+        await adapter.call_tools(mock_messages, tools=[])
+        assert mock_client.chat.completions.create.await_count == 3
+
+        # Other credentials never get this account's cached replies
+        monkeypatch.setattr(adapter.preset, "api_key", "other-key")
+        await _collect(adapter.call_api(mock_messages))
+        assert mock_client.chat.completions.create.await_count == 4
+
+        # The cache is only used when enabled
+        adapter.config.llm.response_cache_ttl = 0
+        await _collect(adapter.call_api(mock_messages))
+        assert mock_client.chat.completions.create.await_count == 5
+
+    async def test_call_api_response_cache_expires(
+        self, adapter, mock_messages, mock_client, monkeypatch
+    ):
+        """Test cached responses expire after the configured TTL"""
+        adapter.config.llm.response_cache_ttl = 5
+        adapter.preset.config.stream = True
+
+        mock_client.chat.completions.create.side_effect = lambda **_: MockAsyncStream(
+            [make_chunk("Hi", "stop")]
         )
 
-        with patch("amrita_core.builtins.adapter.openai.AsyncOpenAI") as mock_openai:
-            mock_client = AsyncMock()
-            mock_client.chat.completions.create.return_value = mock_completion
-            mock_openai.return_value = mock_client
+        clock = SimpleNamespace(now=100.0)
+        monkeypatch.setattr(
+            "amrita_core.builtins.adapter.time.monotonic", lambda: clock.now
+        )
 
-            # Pass a string as tool_choice to test the else branch
-            result = await adapter.call_tools(
-                mock_messages, tools=[], tool_choice="required"
-            )
+        first = await _collect(adapter.call_api(mock_messages))
+        clock.now = 104.0
+        assert await _collect(adapter.call_api(mock_messages)) == first
+        assert mock_client.chat.completions.create.await_count == 1
 
-            assert isinstance(result, UniResponse)
-            assert result.content is None
-            assert result.tool_calls is None
+        clock.now = 106.0
+        await _collect(adapter.call_api(mock_messages))
+        assert mock_client.chat.completions.create.await_count == 2
@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -8,9 +9,9 @@ from amrita_core.builtins.agent import (
     agent_core,
     cookie,
 )
-from amrita_core.chatmanager import ChatObject
-from amrita_core.config import AmritaConfig, FunctionConfig
-from amrita_core.hook.event import CompletionEvent, PreCompletionEvent
+from amrita_core.builtins.tools import REASONING_TOOL, STOP_TOOL
+from amrita_core.config import AmritaConfig
+from amrita_core.hook.event import CompletionEvent
 from amrita_core.protocol import MessageWithMetadata
 from amrita_core.tools.models import ToolData
 from amrita_core.types import (
@@ -20,39 +21,57 @@ from amrita_core.types import (
     UniResponse,
 )
 
+SYSTEM_MSG = Message(role="system", content="System message")
+USER_MSG = Message(role="user", content="User query")
+UNWRAPPED_MESSAGES = (SYSTEM_MSG, USER_MSG)
+
 
 @pytest.fixture
-def mock_config():
-    config = AmritaConfig()
-    config.function_config = FunctionConfig()
-    return config
+def make_pre_completion_event():
+    """Factory for the PreCompletionEvent stand-in the agent_core tests start from"""
+
+    def make():
+        # Only the attributes agent_core touches, no spec introspection needed
+        return SimpleNamespace(
+            chat_object=SimpleNamespace(
+                session_id="test-session",
+                preset="default-preset",
+                yield_response=AsyncMock(),
+                set_queue_done=AsyncMock(),
+            ),
+            message=SimpleNamespace(
+                train=SYSTEM_MSG,
+                user_query=USER_MSG,
+                # agent_core appends to the unwrapped list, hand out a fresh one
+                unwrap=MagicMock(return_value=list(UNWRAPPED_MESSAGES)),
+                extend=MagicMock(),
+                copy=MagicMock(),
+            ),
+            original_context="Original context",
+            get_context_messages=MagicMock(
+                return_value=SimpleNamespace(
+                    train=SimpleNamespace(content="Context content")
+                )
+            ),
+            _context_messages=[],
+        )
+
+    return make
 
 
 @pytest.fixture
-def mock_event():
-    event: PreCompletionEvent = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[
-            Message(role="system", content="System message"),
-            Message(role="user", content="User query"),
-        ]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value = MagicMock()
-    event.get_context_messages.return_value.train = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
-    return event
+def patched_agent():
+    """Patch the agent module's collaborators with a single patcher"""
+    with patch.multiple(
+        "amrita_core.builtins.agent",
+        sessions_manager=DEFAULT,
+        get_config=DEFAULT,
+        tools_caller=DEFAULT,
+        logger=DEFAULT,
+    ) as mocks:
+        yield SimpleNamespace(**mocks)
 
 
-@pytest.mark.asyncio
 async def test_builtin_tools_constants():
     assert len(BUILTIN_TOOLS_NAME) > 0
     assert isinstance(BUILTIN_TOOLS_NAME, set)
@@ -61,175 +80,110 @@ async def test_builtin_tools_constants():
     assert isinstance(AGENT_PROCESS_TOOLS, tuple)
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_basic(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
+@pytest.mark.parametrize(
+    ("tool_calling_mode", "use_minimal_context"),
+    [("agent", False), ("agent", True), ("none", False)],
+    ids=["basic", "minimal_context", "tool_calling_mode_none"],
+)
+async def test_agent_core_context(
+    patched_agent, make_pre_completion_event, tool_calling_mode, use_minimal_context
 ):
+    """Test the context agent_core sends for each calling mode"""
     mock_config: AmritaConfig = MagicMock()
-    mock_config.function_config.tool_calling_mode = "agent"
+    mock_config.function_config.tool_calling_mode = tool_calling_mode
     mock_config.function_config.agent_thought_mode = "reasoning"
     mock_config.function_config.agent_tool_call_limit = 5
     mock_config.function_config.agent_tool_call_notice = "notify"
-    mock_config.function_config.use_minimal_context = False
+    mock_config.function_config.use_minimal_context = use_minimal_context
     mock_config.function_config.agent_reasoning_hide = False
     mock_config.function_config.agent_middle_message = True
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
     mock_session.tools.tools_meta_dict.return_value = {}
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.chat_object.set_queue_done = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[
-            Message(role="system", content="System message"),
-            Message(role="user", content="User query"),
-        ]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value = MagicMock()
-    event.get_context_messages.return_value.train = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     mock_response = MagicMock(spec=UniResponse)
     mock_response.content = None
     mock_response.tool_calls = None
-    mock_tools_caller.return_value = mock_response
+    patched_agent.tools_caller.return_value = mock_response
 
     await agent_core(event, mock_config)
 
-    mock_sessions_manager.assert_called_once()
-
-
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.get_config")
-async def test_cookie_handler(mock_get_config):
-    mock_config = MagicMock()
-    mock_config.cookie.enable_cookie = True
-    mock_config.cookie.cookie = "test-cookie"
-    mock_get_config.return_value = mock_config
-
-    event = MagicMock(spec=CompletionEvent)
-    event.chat_object = MagicMock()
-    event.chat_object.yield_response = AsyncMock()
-    event.chat_object.set_queue_done = AsyncMock()
-    event.get_model_response = MagicMock(
-        return_value="Some response with test-cookie inside"
-    )
-
-    await cookie(event, mock_config)
-
-    event.chat_object.yield_response.assert_called()
-    event.chat_object.set_queue_done.assert_called()
+    patched_agent.sessions_manager.get_session_data.assert_called_once()
+    if tool_calling_mode == "none":
+        # Should return early
+        patched_agent.tools_caller.assert_not_called()
+        return
+    # Minimal context only sends train + user_query instead of the whole history
+    assert event.message.unwrap.called != use_minimal_context
+    assert patched_agent.tools_caller.call_args[0][0] == [
+        event.message.train,
+        event.message.user_query,
+    ]
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.get_config")
-async def test_cookie_handler_no_match(mock_get_config):
+@pytest.mark.parametrize(
+    ("enable", "response", "should_yield"),
+    [
+        (True, "Some response with test-cookie inside", True),
+        (True, "Response without cookie", False),
+        # Should not process cookie when disabled
+        (False, "Response with test-cookie", False),
+    ],
+    ids=["match", "no_match", "disabled"],
+)
+async def test_cookie_handler(enable, response, should_yield):
+    # cookie reads the config it is passed, get_config needs no patch
     mock_config = MagicMock()
-    mock_config.cookie.enable_cookie = True
+    mock_config.cookie.enable_cookie = enable
     mock_config.cookie.cookie = "test-cookie"
-    mock_get_config.return_value = mock_config
 
     event = MagicMock(spec=CompletionEvent)
     event.chat_object = MagicMock()
     event.chat_object.yield_response = AsyncMock()
     event.chat_object.set_queue_done = AsyncMock()
-    event.get_model_response = MagicMock(return_value="Response without cookie")
+    event.get_model_response = MagicMock(return_value=response)
 
     await cookie(event, mock_config)
 
-    event.chat_object.yield_response.assert_not_called()
-    event.chat_object.set_queue_done.assert_not_called()
+    assert event.chat_object.yield_response.called == should_yield
+    assert event.chat_object.set_queue_done.called == should_yield
 
 
 # Additional tests for uncovered code paths
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_tool_calling_mode_none(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
-    """Test when tool_calling_mode is 'none' - should return early"""
-    mock_config = MagicMock()
-    mock_config.function_config.tool_calling_mode = "none"
-    mock_get_config.return_value = mock_config
-
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-
-    await agent_core(event, mock_config)
-
-    # tools_caller should not be called
-    mock_tools_caller.assert_not_called()
-
-
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-@patch("amrita_core.builtins.agent.logger")
-async def test_agent_core_no_valid_tools(
-    mock_logger, mock_tools_caller, mock_get_config, mock_sessions_manager
-):
+async def test_agent_core_no_valid_tools(patched_agent, make_pre_completion_event):
     """Test when no valid tools are defined"""
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = (
         "custom"  # Not "agent", so no built-in tools
     )
     mock_config.function_config.agent_tool_call_limit = 5
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
     mock_session.tools.tools_meta_dict.return_value = {}  # No custom tools
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
-
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
+
+    event = make_pre_completion_event()
 
     await agent_core(event, mock_config)
 
     # Should not call tools_caller and should log warning
-    mock_tools_caller.assert_not_called()
-    mock_logger.warning.assert_called_with(
+    patched_agent.tools_caller.assert_not_called()
+    patched_agent.logger.warning.assert_called_with(
         "No valid tools defined! Tools Workflow skipped."
     )
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
 async def test_agent_core_successful_tool_call(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
+    patched_agent, make_pre_completion_event
 ):
     """Test successful custom tool call"""
     mock_config = MagicMock()
@@ -237,7 +191,7 @@ async def test_agent_core_successful_tool_call(
     mock_config.function_config.agent_tool_call_limit = 5
     mock_config.function_config.agent_tool_call_notice = "notify"
     mock_config.function_config.use_minimal_context = False
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     # Mock a custom tool
     mock_session = MagicMock()
@@ -249,23 +203,9 @@ async def test_agent_core_successful_tool_call(
     mock_session.tools.tools_meta_dict.return_value = {
         "custom_tool": {"function": {"name": "custom_tool", "description": "test"}}
     }
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     # Create proper ToolCall with real objects
     tool_call = ToolCall(
@@ -277,7 +217,7 @@ async def test_agent_core_successful_tool_call(
         content=None,
         tool_calls=[tool_call],
     )
-    mock_tools_caller.return_value = response
+    patched_agent.tools_caller.return_value = response
 
     await agent_core(event, mock_config)
 
@@ -286,19 +226,13 @@ async def test_agent_core_successful_tool_call(
     assert len(event.message.extend.call_args[0][0]) > 0  # Messages were extended
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_tool_call_failure(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
+async def test_agent_core_tool_call_failure(patched_agent, make_pre_completion_event):
     """Test tool call failure handling"""
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = "agent"
     mock_config.function_config.agent_tool_call_limit = 5
     mock_config.function_config.agent_tool_call_notice = "notify"
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
@@ -309,23 +243,9 @@ async def test_agent_core_tool_call_failure(
     mock_session.tools.tools_meta_dict.return_value = {
         "failing_tool": {"function": {"name": "failing_tool", "description": "test"}}
     }
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     tool_call = ToolCall(
         id="tool-call-1",
@@ -336,7 +256,7 @@ async def test_agent_core_tool_call_failure(
         content=None,
         tool_calls=[tool_call],
     )
-    mock_tools_caller.return_value = response
+    patched_agent.tools_caller.return_value = response
 
     await agent_core(event, mock_config)
 
@@ -344,19 +264,15 @@ async def test_agent_core_tool_call_failure(
     assert len(event.message.extend.call_args[0][0]) > 0  # Error message was added
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
 async def test_agent_core_tool_call_limit_reached(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
+    patched_agent, make_pre_completion_event
 ):
     """Test when tool call limit is reached"""
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = "agent"
     mock_config.function_config.agent_tool_call_limit = 2  # Low limit for testing
     mock_config.function_config.agent_tool_call_notice = "notify"
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
@@ -367,23 +283,9 @@ async def test_agent_core_tool_call_limit_reached(
     mock_session.tools.tools_meta_dict.return_value = {
         "loop_tool": {"function": {"name": "loop_tool", "description": "test"}}
     }
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     tool_call = ToolCall(
         id="tool-call-1",
@@ -394,7 +296,7 @@ async def test_agent_core_tool_call_limit_reached(
         content=None,
         tool_calls=[tool_call],
     )
-    mock_tools_caller.return_value = response
+    patched_agent.tools_caller.return_value = response
 
     await agent_core(event, mock_config)
 
@@ -411,43 +313,21 @@ async def test_agent_core_tool_call_limit_reached(
     assert limit_exceeded_call is not None, "Limit exceeded message was not sent"
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_reasoning_tool(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
+async def test_agent_core_reasoning_tool(patched_agent, make_pre_completion_event):
     """Test reasoning tool handling"""
-    from amrita_core.builtins.tools import REASONING_TOOL
-
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = "agent"
     mock_config.function_config.agent_thought_mode = "reasoning"
     mock_config.function_config.agent_tool_call_limit = 5
     mock_config.function_config.agent_reasoning_hide = False
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
     mock_session.tools.tools_meta_dict.return_value = {}
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     # First call: reasoning tool
     reasoning_call = ToolCall(
@@ -469,49 +349,27 @@ async def test_agent_core_reasoning_tool(
         tool_calls=None,
     )
 
-    mock_tools_caller.side_effect = [reasoning_response, final_response]
+    patched_agent.tools_caller.side_effect = [reasoning_response, final_response]
 
     await agent_core(event, mock_config)
 
     # Should have called tools_caller twice and handled reasoning
-    assert mock_tools_caller.call_count == 2
+    assert patched_agent.tools_caller.call_count == 2
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_stop_tool(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
+async def test_agent_core_stop_tool(patched_agent, make_pre_completion_event):
     """Test stop tool handling"""
-    from amrita_core.builtins.tools import STOP_TOOL
-
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = "agent"
     mock_config.function_config.agent_tool_call_limit = 5
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
     mock_session.tools.tools_meta_dict.return_value = {}
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     stop_call = ToolCall(
         id="stop-1",
@@ -525,7 +383,7 @@ async def test_agent_core_stop_tool(
         tool_calls=[stop_call],
     )
 
-    mock_tools_caller.return_value = stop_response
+    patched_agent.tools_caller.return_value = stop_response
 
     await agent_core(event, mock_config)
 
@@ -533,18 +391,12 @@ async def test_agent_core_stop_tool(
     assert len(event.message.extend.call_args[0][0]) > 0
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_custom_run_tool(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
+async def test_agent_core_custom_run_tool(patched_agent, make_pre_completion_event):
     """Test custom run tool handling"""
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = "agent"
     mock_config.function_config.agent_tool_call_limit = 5
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     async def custom_tool_func(ctx):
         await ctx.event.chat_object.yield_response(
@@ -565,23 +417,9 @@ async def test_agent_core_custom_run_tool(
             "function": {"name": "custom_run_tool", "description": "test"}
         }
     }
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     tool_call = ToolCall(
         id="tool-call-1",
@@ -592,7 +430,7 @@ async def test_agent_core_custom_run_tool(
         content=None,
         tool_calls=[tool_call],
     )
-    mock_tools_caller.return_value = response
+    patched_agent.tools_caller.return_value = response
 
     await agent_core(event, mock_config)
 
@@ -602,42 +440,22 @@ async def test_agent_core_custom_run_tool(
     )  # At least initial + custom tool
 
 
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_exception_handling(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
+async def test_agent_core_exception_handling(patched_agent, make_pre_completion_event):
     """Test general exception handling in agent core"""
     mock_config = MagicMock()
     mock_config.function_config.tool_calling_mode = "agent"
     mock_config.function_config.agent_tool_call_limit = 5
-    mock_get_config.return_value = mock_config
+    patched_agent.get_config.return_value = mock_config
 
     mock_session = MagicMock()
     mock_session.tools = MagicMock()
     mock_session.tools.tools_meta_dict.return_value = {}
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
+    patched_agent.sessions_manager.get_session_data.return_value = mock_session
 
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
+    event = make_pre_completion_event()
 
     # Make tools_caller raise an exception
-    mock_tools_caller.side_effect = RuntimeError("Unexpected error")
+    patched_agent.tools_caller.side_effect = RuntimeError("Unexpected error")
 
     await agent_core(event, mock_config)
 
@@ -651,74 +469,3 @@ async def test_agent_core_exception_handling(
                 break
 
     assert error_call_found, "Error response was not sent"
-
-
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.SessionsManager")
-@patch("amrita_core.builtins.agent.get_config")
-@patch("amrita_core.builtins.agent.tools_caller")
-async def test_agent_core_minimal_context(
-    mock_tools_caller, mock_get_config, mock_sessions_manager
-):
-    """Test minimal context mode"""
-    mock_config = MagicMock()
-    mock_config.function_config.tool_calling_mode = "agent"
-    mock_config.function_config.agent_tool_call_limit = 5
-    mock_config.function_config.use_minimal_context = True
-    mock_get_config.return_value = mock_config
-
-    mock_session = MagicMock()
-    mock_session.tools = MagicMock()
-    mock_session.tools.tools_meta_dict.return_value = {}
-    mock_sessions_manager.return_value.get_session_data.return_value = mock_session
-
-    event = MagicMock(spec=PreCompletionEvent)
-    event.chat_object = MagicMock(spec=ChatObject)
-    event.chat_object.session_id = "test-session"
-    event.chat_object.preset = "default-preset"
-    event.chat_object.yield_response = AsyncMock()
-    event.message = MagicMock()
-    event.message.train = Message(role="system", content="System message")
-    event.message.user_query = Message(role="user", content="User query")
-    event.message.unwrap = MagicMock(
-        return_value=[event.message.train, event.message.user_query]
-    )
-    event.original_context = "Original context"
-    event.get_context_messages = MagicMock()
-    event.get_context_messages.return_value.train.content = "Context content"
-    event._context_messages = []
-
-    mock_response = MagicMock(spec=UniResponse)
-    mock_response.content = None
-    mock_response.tool_calls = None
-    mock_tools_caller.return_value = mock_response
-
-    await agent_core(event, mock_config)
-
-    # Should use minimal context (only train + user_query)
-    assert mock_tools_caller.call_args[0][0] == [
-        event.message.train,
-        event.message.user_query,
-    ]
-
-
-@pytest.mark.asyncio
-@patch("amrita_core.builtins.agent.get_config")
-async def test_cookie_handler_disabled(mock_get_config):
-    """Test cookie handler when disabled"""
-    mock_config = MagicMock()
-    mock_config.cookie.enable_cookie = False
-    mock_config.cookie.cookie = "test-cookie"
-    mock_get_config.return_value = mock_config
-
-    event = MagicMock(spec=CompletionEvent)
-    event.chat_object = MagicMock()
-    event.chat_object.yield_response = AsyncMock()
-    event.chat_object.set_queue_done = AsyncMock()
-    event.get_model_response = MagicMock(return_value="Response with test-cookie")
-
-    await cookie(event, mock_config)
-
-    # Should not process cookie when disabled
-    event.chat_object.yield_response.assert_not_called()
-    event.chat_object.set_queue_done.assert_not_called()
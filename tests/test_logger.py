@@ -7,3 +7,54 @@ def test_logger():
     lg.debug = False
     lg.logger.debug("EHLO")
     lg.logger.info("Using logger")
+
+
+def test_loguru_handler_reports_caller():
+    import logging
+
+    from amrita_core import logging as lg
+
+    records = []
+    sink_id = lg.logger.add(lambda msg: records.append(msg.record), level=0)
+    std_logger = logging.getLogger("amrita_core.tests.loguru_handler")
+    handler = lg.LoguruHandler()
+    std_logger.addHandler(handler)
+    std_logger.setLevel(logging.INFO)
+    std_logger.propagate = False
+    try:
+        std_logger.info("via stdlib")
+        std_logger.log(logging.WARNING, "via stdlib log()")
+    finally:
+        std_logger.removeHandler(handler)
+        lg.logger.remove(sink_id)
+
+    assert [r["message"] for r in records] == ["via stdlib", "via stdlib log()"]
+    assert all(r["function"] == "test_loguru_handler_reports_caller" for r in records)
+
+
+def test_loguru_handler_reports_caller_of_direct_handle():
+    import logging
+
+    from amrita_core import logging as lg
+
+    records = []
+    sink_id = lg.logger.add(lambda msg: records.append(msg.record), level=0)
+    record = logging.LogRecord(
+        "amrita_core.tests.loguru_handler",
+        logging.INFO,
+        __file__,
+        0,
+        "direct",
+        (),
+        None,
+    )
+    try:
+        # Skips the Logger frames, as QueueListener does
+        lg.LoguruHandler().handle(record)
+    finally:
+        lg.logger.remove(sink_id)
+
+    assert [r["message"] for r in records] == ["direct"]
+    assert (
+        records[0]["function"] == "test_loguru_handler_reports_caller_of_direct_handle"
+    )
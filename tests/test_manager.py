@@ -18,6 +18,21 @@ from amrita_core.tools.models import (
 )
 
 
+def _make_tool(name: str) -> ToolData:
+    return ToolData(
+        data=ToolFunctionSchema(
+            function=FunctionDefinitionSchema(
+                name=name,
+                description=f"{name} tool",
+                parameters=FunctionParametersSchema(
+                    type="object", properties={}, required=[]
+                ),
+            )
+        ),
+        func=MagicMock(),
+    )
+
+
 class TestMultiToolsManager:
     @pytest.fixture
     def manager(self) -> MultiToolsManager:
@@ -122,6 +137,46 @@ class TestMultiToolsManager:
         meta_dict = manager.tools_meta_dict()
         assert "test_tool" in meta_dict
 
+    def test_register_tools(self, manager: MultiToolsManager):
+        manager.register_tools([_make_tool("a"), _make_tool("b")])
+        assert list(manager.get_tools()) == ["a", "b"]
+
+        # A conflicting batch registers nothing
+        with pytest.raises(ValueError, match="already exists"):
+            manager.register_tools([_make_tool("c"), _make_tool("a")])
+        with pytest.raises(ValueError, match="already exists"):
+            manager.register_tools([_make_tool("d"), _make_tool("d")])
+        assert list(manager.get_tools()) == ["a", "b"]
+
+    def test_tools_snapshot_invalidation(self, manager: MultiToolsManager):
+        static_tool = _make_tool("static_tool")
+        manager.register_tool(static_tool)
+        first = manager.tools_meta_dict()
+        assert list(first) == ["static_tool"]
+        # Callers get their own copies, changing them leaves the cache intact
+        first["static_tool"]["function"]["parameters"]["required"].append("x")
+        first["static_tool"]["function"]["name"] = "changed"
+        second = manager.tools_meta_dict()
+        assert second["static_tool"] == static_tool.data.model_dump()
+        assert second["static_tool"] is not first["static_tool"]
+
+        enabled = True
+        dynamic_tool = _make_tool("dynamic_tool")
+        dynamic_tool.enable_if = lambda: enabled
+        manager.register_tool(dynamic_tool)
+        assert list(manager.get_tools()) == ["static_tool", "dynamic_tool"]
+
+        enabled = False
+        assert list(manager.get_tools()) == ["static_tool"]
+        assert list(manager.tools_meta_dict()) == ["static_tool"]
+
+        manager.disable_tool("static_tool")
+        assert manager.tools_meta() == {}
+        manager.enable_tool("static_tool")
+        assert list(manager.tools_meta()) == ["static_tool"]
+        manager.remove_tool("static_tool")
+        assert manager.get_tools() == {}
+
 
 class TestToolsManagerSingleton:
     def test_singleton_behavior(self):
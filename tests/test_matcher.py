@@ -1,4 +1,6 @@
 import asyncio
+import gc
+import weakref
 
 import pytest
 from exceptiongroup import ExceptionGroup
@@ -593,6 +595,42 @@ class TestEventRegistry:
         handlers = registry.get_handlers("nonexistent_event")
         assert handlers == {}
 
+    def test_has_handlers(self):
+        """Test registered-type lookup does not create empty entries."""
+        registry = EventRegistry()
+        assert not registry.has_handlers("unsubscribed_event")
+        assert registry.handlers("unsubscribed_event") == {}
+        assert "unsubscribed_event" not in registry.get_all()
+
+        matcher = Matcher("subscribed_event", block=False)
+
+        @matcher.handle()
+        async def test_handler(event: TestEvent):
+            pass
+
+        assert registry.has_handlers("subscribed_event")
+        assert registry.handlers("subscribed_event")[matcher.priority][0].function == (
+            test_handler
+        )
+
+        # Clearing the handlers is enough to unsubscribe
+        registry.get_all().clear()
+        assert not registry.has_handlers("subscribed_event")
+
+    def test_unregistered_handler_is_released(self):
+        """Test nothing but the registry keeps a registered handler alive."""
+        registry = EventRegistry()
+
+        async def test_handler(event: TestEvent):
+            pass
+
+        Matcher("released_event").append_handler(test_handler)
+        ref = weakref.ref(test_handler)
+        del test_handler
+        registry.get_all().pop("released_event")
+        gc.collect()
+        assert ref() is None
+
 
 # Integration tests for complete workflow
 class TestMatcherIntegration:
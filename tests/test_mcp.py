@@ -1,13 +1,37 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastmcp.exceptions import ToolError
+from mcp.types import ImageContent, TextContent, Tool
 
+from amrita_core.tools.manager import MultiToolsManager
 from amrita_core.tools.mcp import (
     NOT_GIVEN,
     ClientManager,
     MCPClient,
     MultiClientManager,
 )
+from amrita_core.tools.models import (
+    FunctionDefinitionSchema,
+    FunctionParametersSchema,
+    MCPToolSchema,
+    ToolData,
+    ToolFunctionSchema,
+    cast_mcp_properties_to_amrita,
+)
+
+
+def _tool_schema(name: str) -> ToolFunctionSchema:
+    return ToolFunctionSchema(
+        function=FunctionDefinitionSchema(
+            name=name,
+            description="Test tool",
+            parameters=FunctionParametersSchema(type="object", properties={}),
+        )
+    )
 
 
 class TestMCPClient:
@@ -22,11 +46,24 @@ class TestMCPClient:
         assert mcp_client.openai_tools == []
 
     @pytest.mark.asyncio
-    async def test_aenter_and_aexit(self, mcp_client: MCPClient):
-        with patch.object(mcp_client, "_connect") as mock_connect:
-            result = await mcp_client.__aenter__()
-            assert result == mcp_client
-            mock_connect.assert_called_once()
+    @patch("amrita_core.tools.mcp.Client")
+    async def test_aenter_and_aexit(self, mock_client_class, mcp_client: MCPClient):
+        mock_client_instance = AsyncMock()
+        mock_client_class.return_value = mock_client_instance
+        mock_client_instance.list_tools.return_value = []
+
+        async with mcp_client as result:
+            assert result is mcp_client
+            assert mcp_client.mcp_client is mock_client_instance
+        mock_client_instance.__aexit__.assert_awaited_once()
+        assert mcp_client.mcp_client is None
+
+        # Entering an already connected client reuses its connection
+        await mcp_client._ensure_connected()
+        async with mcp_client:
+            mock_client_class.assert_called_with("test_script")
+            assert mock_client_class.call_count == 2
+            assert mcp_client.mcp_client is mock_client_instance
 
     @pytest.mark.asyncio
     @patch("amrita_core.tools.mcp.Client")
@@ -46,6 +83,91 @@ class TestMCPClient:
         # Verify that the connection was successful
         assert client.mcp_client is not None
 
+    @pytest.mark.asyncio
+    @patch("amrita_core.tools.mcp.Client")
+    async def test_connect_reuses_unchanged_tools(self, mock_client_class):
+        mock_client_instance = AsyncMock()
+        mock_client_class.return_value = mock_client_instance
+        mock_client_instance.list_tools.return_value = [
+            Tool(
+                name="echo",
+                description="Echo text",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"text": {"type": "string"}},
+                    "required": ["text"],
+                },
+                outputSchema={"type": "object", "properties": {}},
+            )
+        ]
+
+        client = MCPClient(server_script="test_script")
+        await client._connect(update_tools=True)
+        openai_tools = client.get_tools()
+        assert [tool.function.name for tool in openai_tools] == ["echo"]
+        assert client.get_original_tools()[0].description == "Echo text"
+        await client._close()
+
+        # Same tool list on reconnect, the converted schemas are kept as-is
+        with patch.object(client, "_cast_tool_to_amrita") as mock_cast:
+            await client._connect(update_tools=True)
+            mock_cast.assert_not_called()
+        assert client.get_tools() is openai_tools
+
+    def test_format_tools_for_openai(self, mcp_client: MCPClient):
+        mcp_client.tools = [
+            MCPToolSchema.model_validate(
+                {
+                    "name": "search",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {
+                            "query": {"type": "string", "description": "Query"},
+                            "mode": {"type": "string", "enum": ["fast", "full"]},
+                            "limit": {"type": "integer", "minimum": 1},
+                            "tags": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "minItems": 1,
+                                "uniqueItems": True,
+                            },
+                            "filters": {
+                                "type": "object",
+                                "properties": {"lang": {"type": "string"}},
+                                "required": ["lang"],
+                            },
+                            "extra": {"type": "object", "properties": {}},
+                        },
+                        "required": ["query"],
+                    },
+                }
+            )
+        ]
+
+        dumped = [tool.model_dump() for tool in mcp_client._format_tools_for_openai()]
+        # Built without validation, the result must still be a valid schema
+        assert [
+            ToolFunctionSchema.model_validate(tool).model_dump() for tool in dumped
+        ] == dumped
+        parameters = dumped[0]["function"]["parameters"]
+        assert parameters["required"] == ["query"]
+        properties = parameters["properties"]
+        assert properties["mode"]["enum"] == ["fast", "full"]
+        assert properties["tags"] == {
+            "type": "array",
+            "description": "No description",
+            "items": {"type": "string", "description": "No description"},
+            "minItems": 1,
+            "uniqueItems": True,
+        }
+        assert properties["filters"]["required"] == ["lang"]
+        assert properties["extra"] == {
+            "type": "object",
+            "description": "No description",
+            "properties": {},
+            "required": [],
+        }
+
     @pytest.mark.asyncio
     async def test_simple_call(self, mcp_client):
         # Test simple call
@@ -67,7 +189,87 @@ class TestMCPClient:
             mock_client.call_tool.assert_called_once_with(
                 "test_tool", {"param": "value"}
             )
-            mock_close.assert_called_once()
+            # The connection is kept open for the next call
+            mock_close.assert_not_called()
+            assert mcp_client.mcp_client is mock_client
+
+            mock_result.content = [
+                TextContent(type="text", text="first"),
+                ImageContent(type="image", data="", mimeType="image/png"),
+                TextContent(type="text", text="second"),
+            ]
+            assert (
+                await mcp_client.simple_call("test_tool", {}) == "first\n\nsecond\n\n"
+            )
+
+    @pytest.mark.asyncio
+    @patch("amrita_core.tools.mcp.Client")
+    async def test_simple_call_reuses_connection(self, mock_client_class):
+        mock_client_instance = AsyncMock()
+        mock_client_class.return_value = mock_client_instance
+        mock_client_instance.list_tools.return_value = []
+        mock_client_instance.call_tool.return_value = MagicMock(content=[])
+
+        client = MCPClient(server_script="test_script")
+        await asyncio.gather(*(client.simple_call("tool", {}) for _ in range(3)))
+        await client.simple_call("tool", {})
+
+        # Concurrent first calls still open a single connection
+        mock_client_class.assert_called_once_with("test_script")
+        assert mock_client_instance.call_tool.await_count == 4
+
+        # Tool errors keep the connection, other failures drop it
+        mock_client_instance.call_tool.side_effect = ToolError("bad arguments")
+        assert "bad arguments" in await client.simple_call("tool", {})
+        assert client.mcp_client is mock_client_instance
+        mock_client_instance.call_tool.side_effect = ConnectionError("gone")
+        assert "gone" in await client.simple_call("tool", {})
+        assert client.mcp_client is None
+
+    @pytest.mark.asyncio
+    @patch("amrita_core.tools.mcp.Client")
+    async def test_failed_call_keeps_connection_for_in_flight_calls(
+        self, mock_client_class
+    ):
+        first, second = AsyncMock(), AsyncMock()
+        mock_client_class.side_effect = [first, second]
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def call_tool(tool_name: str, data: dict):
+            if tool_name == "broken":
+                raise ConnectionError("gone")
+            started.set()
+            await release.wait()
+            return MagicMock(content=[TextContent(type="text", text=tool_name)])
+
+        for instance in (first, second):
+            instance.list_tools.return_value = []
+            instance.call_tool.side_effect = call_tool
+
+        client = MCPClient(server_script="test_script")
+        slow = asyncio.create_task(client.simple_call("slow", {}))
+        await started.wait()
+        assert "gone" in await client.simple_call("broken", {})
+        # The broken connection is unpublished, but not closed under the slow call
+        assert client.mcp_client is None
+        first.__aexit__.assert_not_awaited()
+
+        started.clear()
+        fresh = asyncio.create_task(client.simple_call("fresh", {}))
+        await started.wait()
+        assert client.mcp_client is second
+        release.set()
+        assert await slow == "slow\n\n"
+        assert await fresh == "fresh\n\n"
+        # The old connection is closed once its last call is done, the new one is kept
+        first.__aexit__.assert_awaited_once()
+        second.__aexit__.assert_not_awaited()
+        assert client._leases == {}
+
+        await client._close()
+        second.__aexit__.assert_awaited_once()
+        assert client.mcp_client is None
 
 
 class TestMultiClientManager:
@@ -78,8 +280,6 @@ class TestMultiClientManager:
         manager.clients = []
         manager.script_to_clients = {}
         manager.name_to_clients = {}
-        manager.tools_remapping = {}
-        manager.reversed_remappings = {}
         return manager
 
     def test_initialization(self):
@@ -123,6 +323,213 @@ class TestMultiClientManager:
             assert result == manager
             mock_load.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_initialize_all_registers_under_lock(self, manager):
+        client = MCPClient(server_script="test_script")
+        manager.clients = [client]
+        connected = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_connect(self: MCPClient, update_tools: bool = False):
+            connected.set()
+            await release.wait()
+
+        with (
+            patch.object(MCPClient, "_connect", fake_connect),
+            patch.object(manager, "_register_tools") as mock_register,
+        ):
+            task = asyncio.create_task(manager.initialize_all())
+            await connected.wait()
+            # Connecting does not hold the lock, only registering does
+            assert not manager._lock.locked()
+            await manager._lock.acquire()
+            release.set()
+            await asyncio.sleep(0.01)
+            mock_register.assert_not_called()
+            manager._lock.release()
+            await task
+            mock_register.assert_called_once_with(client, [])
+        assert manager._is_initialized
+
+    @pytest.mark.asyncio
+    async def test_loading_waits_for_reinitialize(self):
+        manager = MultiClientManager(tools_manager=MultiToolsManager())
+        old = MCPClient(server_script="old")
+        manager.register_only(client=old)
+        manager.script_to_clients["old"] = old
+        release = {"old": asyncio.Event(), "updated": asyncio.Event()}
+
+        async def fake_connect(self: MCPClient, update_tools: bool = False):
+            self.openai_tools = [_tool_schema(f"{self.server_script}_tool")]
+            if (event := release.get(str(self.server_script))) is not None:
+                await event.wait()
+
+        with patch.object(MCPClient, "_connect", fake_connect):
+            # Started first, so it is already connecting when the rebuild takes the lock
+            update = asyncio.create_task(
+                manager.update_tools(MCPClient(server_script="updated"))
+            )
+            await asyncio.sleep(0)
+            reinit = asyncio.create_task(manager.reinitalize_all())
+            await asyncio.sleep(0)
+            assert manager._lock.locked()
+            init = asyncio.create_task(manager.initialize_this("new"))
+            release["updated"].set()
+            await asyncio.sleep(0.01)
+            # The servers are connected, but register only once the lock is free
+            assert "new_tool" not in manager.name_to_clients
+            assert "updated_tool" not in manager.name_to_clients
+            release["old"].set()
+            await asyncio.gather(reinit, init, update)
+        assert set(manager.name_to_clients) == {"old_tool", "new_tool", "updated_tool"}
+        assert [c.server_script for c in manager.clients] == ["old", "new"]
+
+    @pytest.mark.asyncio
+    @patch("amrita_core.tools.mcp.Client")
+    async def test_update_tools_refreshes_tool_list(self, mock_client_class):
+        mock_client_instance = AsyncMock()
+        mock_client_class.return_value = mock_client_instance
+        mock_client_instance.list_tools.return_value = [
+            Tool(name="echo", inputSchema={"type": "object", "properties": {}})
+        ]
+        manager = MultiClientManager(tools_manager=MultiToolsManager())
+        tm = manager.tools_manager
+        client = MCPClient(server_script="test_script")
+        await manager._load_this(client)
+        openai_tools = client.get_tools()
+
+        # An unchanged tool list is re-read, but its converted schemas are kept
+        await manager.update_tools(client)
+        assert mock_client_instance.list_tools.await_count == 2
+        assert client.get_tools() is openai_tools
+        assert tm.has_tool("echo")
+
+        mock_client_instance.list_tools.return_value = [
+            Tool(name="add", inputSchema={"type": "object", "properties": {}})
+        ]
+        await manager.update_tools(client)
+        assert [tool.function.name for tool in client.get_tools()] == ["add"]
+        assert tm.has_tool("add")
+        assert not tm.has_tool("echo")
+        assert set(manager.name_to_clients) == {"add"}
+
+    @pytest.mark.asyncio
+    async def test_get_client_by_tool_name_waits_for_writer(self, manager):
+        client = MCPClient(server_script="test_script")
+        manager.name_to_clients["referred_1_tool"] = client
+        manager.tools_remapping["tool"] = "referred_1_tool"
+
+        assert await manager.get_client_by_tool_name("tool") is client
+        with pytest.raises(RuntimeError, match="Tool not found"):
+            await manager.get_client_by_tool_name("missing")
+
+        # While a writer holds the lock, readers wait for it to finish
+        await manager._lock.acquire()
+        lookup = asyncio.create_task(manager.get_client_by_tool_name("tool"))
+        await asyncio.sleep(0)
+        assert not lookup.done()
+        manager._lock.release()
+        assert await lookup is client
+
+    def test_register_tools_remaps_without_collisions(self):
+        manager = MultiClientManager(tools_manager=MultiToolsManager())
+        tm = manager.tools_manager
+        tm.register_tool(ToolData(data=_tool_schema("echo"), func=AsyncMock()))
+        # Occupy the first candidate name, it must be skipped
+        tm.register_tool(
+            ToolData(data=_tool_schema("referred_1_echo"), func=AsyncMock())
+        )
+
+        first = MCPClient(server_script="first")
+        second = MCPClient(server_script="second")
+        manager._register_tools(first, [_tool_schema("echo")])
+        assert manager.tools_remapping["echo"] == "referred_2_echo"
+        manager._register_tools(second, [_tool_schema("echo")])
+        assert manager.tools_remapping["echo"] == "referred_3_echo"
+
+        assert tm.has_tool("referred_2_echo")
+        assert tm.has_tool("referred_3_echo")
+        # The reverse mapping follows the latest remap of each name
+        assert manager.reversed_remappings == {"referred_3_echo": "echo"}
+        with pytest.raises(TypeError):
+            manager.reversed_remappings["referred_2_echo"] = "echo"  # pyright: ignore[reportIndexIssue]
+        assert manager.tools_remapping.pop("echo") == "referred_3_echo"
+        assert manager.reversed_remappings == {}
+        # The client keeps its original tool names
+        assert manager.name_to_clients["echo"] is second
+
+    def test_tools_remapping_keeps_inverse_in_sync(self):
+        remapping = MultiClientManager(
+            tools_manager=MultiToolsManager()
+        ).tools_remapping
+        assert remapping.setdefault("echo", "referred_1_echo") == "referred_1_echo"
+        assert remapping.setdefault("echo", "referred_2_echo") == "referred_1_echo"
+        remapping |= {"echo": "referred_3_echo", "add": "referred_1_add"}
+        assert remapping.inverse == {"referred_3_echo": "echo", "referred_1_add": "add"}
+
+        copied = remapping.copy()
+        copied["sub"] = "referred_1_sub"
+        assert "sub" not in remapping
+        assert "referred_1_sub" not in remapping.inverse
+
+        _, remapped = remapping.popitem()
+        assert remapped not in remapping.inverse
+        assert remapping.inverse == {v: k for k, v in remapping.items()}
+        remapping.clear()
+        assert remapping == {}
+        assert remapping.inverse == {}
+
+    @pytest.mark.asyncio
+    async def test_session_closes_connections(self, manager):
+        clients = [MCPClient(server_script=f"script_{i}") for i in range(2)]
+        manager.clients = clients
+        with patch.object(MCPClient, "_close") as mock_close:
+            async with manager.session() as session:
+                assert session is manager
+                mock_close.assert_not_called()
+        assert mock_close.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_call_many(self, manager):
+        first = MCPClient(server_script="first")
+        second = MCPClient(server_script="second")
+        manager.name_to_clients.update({"a": first, "b": second})
+        started: list[str] = []
+        all_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_call(self: MCPClient, tool_name: str, data: dict) -> str:
+            started.append(tool_name)
+            if len(started) == 3:
+                all_started.set()
+            await release.wait()
+            return f"{self.server_script}:{tool_name}:{data['x']}"
+
+        with patch.object(MCPClient, "simple_call", fake_call):
+            task = asyncio.create_task(
+                manager.call_many([("a", {"x": 1}), ("b", {"x": 2}), ("a", {"x": 3})])
+            )
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            # Every call is in flight before any of them completes
+            assert sorted(started) == ["a", "a", "b"]
+            release.set()
+            assert await task == ["first:a:1", "second:b:2", "first:a:3"]
+
+    @pytest.mark.asyncio
+    async def test_unregister_client(self, manager):
+        script = Path("server.py")
+        client = MCPClient(server_script=script)
+        other = MCPClient(server_script="other.py")
+        manager.clients = [other, client]
+        manager.script_to_clients = {str(script): client, "other.py": other}
+
+        await manager.unregister_client(script)
+        assert manager.clients == [other]
+        assert "server.py" not in manager.script_to_clients
+        # Unknown scripts are ignored
+        await manager.unregister_client("missing.py")
+        assert manager.clients == [other]
+
     def test_tools_wrapper(self):
         manager = MultiClientManager()
         # Test tools wrapper
@@ -140,6 +547,15 @@ class TestClientManager:
         manager2 = ClientManager()
         assert manager1 is manager2
 
+    def test_singleton_concurrent_construction(self):
+        ClientManager._instance = None
+        ClientManager._initialized = False
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            managers = list(pool.map(lambda _: ClientManager(), range(32)))
+        assert all(manager is managers[0] for manager in managers)
+        assert isinstance(managers[0]._lock, asyncio.Lock)
+
     def test_inheritance_from_multi_client_manager(self):
         # Reset ClientManager state
         ClientManager._instance = None
@@ -153,3 +569,24 @@ def test_not_given():
     # Test NOT_GIVEN class
     assert NOT_GIVEN is not None
     assert isinstance(NOT_GIVEN, type)
+
+
+def test_cast_mcp_properties_cached():
+    def properties(description: str):
+        return MCPToolSchema.model_validate(
+            {
+                "name": "tool",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {"type": "string", "description": description}
+                    },
+                },
+            }
+        ).inputSchema.properties
+
+    first = cast_mcp_properties_to_amrita(properties("Text"))
+    # Equal schemas from another tool share the converted property
+    assert cast_mcp_properties_to_amrita(properties("Text"))["text"] is first["text"]
+    other = cast_mcp_properties_to_amrita(properties("Other"))
+    assert other["text"].description == "Other"
@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import patch
 
 import pytest
 
 from amrita_core.preset import (
+    _PROMPT_TOKENS,
     TEST_MSG_LIST,
     TEST_MSG_PROMPT,
     TEST_MSG_USER,
@@ -193,9 +195,7 @@ class TestPresetTesting:
         preset = create_test_preset("test_success", "__main__")
 
         # Mock the adapter manager to return our mock adapter
-        with patch("amrita_core.preset.AdapterManager") as mock_adapter_manager_class:
-            mock_instance = MagicMock()
-            mock_adapter_manager_class.return_value = mock_instance
+        with patch("amrita_core.preset.adapter_manager") as mock_instance:
             mock_instance.safe_get_adapter.return_value = MockModelAdapter
 
             # Mock hybrid_token_count
@@ -207,7 +207,7 @@ class TestPresetTesting:
                 assert report.status is True
                 assert report.message == ""
                 assert report.test_output is not None
-                assert report.token_prompt == 10
+                assert report.token_prompt == _PROMPT_TOKENS
                 assert report.token_completion > 0
 
     @pytest.mark.asyncio
@@ -217,9 +217,7 @@ class TestPresetTesting:
         preset = create_test_preset("test_by_string", "__main__")
         manager.add_preset(preset)
 
-        with patch("amrita_core.preset.AdapterManager") as mock_adapter_manager_class:
-            mock_instance = MagicMock()
-            mock_adapter_manager_class.return_value = mock_instance
+        with patch("amrita_core.preset.adapter_manager") as mock_instance:
             mock_instance.safe_get_adapter.return_value = MockModelAdapter
 
             with patch("amrita_core.preset.hybrid_token_count", return_value=10):
@@ -234,9 +232,7 @@ class TestPresetTesting:
         manager = MultiPresetManager()
         preset = create_test_preset("test_undefined", "undefined_protocol")
 
-        with patch("amrita_core.preset.AdapterManager") as mock_adapter_manager_class:
-            mock_instance = MagicMock()
-            mock_adapter_manager_class.return_value = mock_instance
+        with patch("amrita_core.preset.adapter_manager") as mock_instance:
             mock_instance.safe_get_adapter.return_value = None
 
             with patch("amrita_core.preset.hybrid_token_count", return_value=10):
@@ -264,9 +260,7 @@ class TestPresetTesting:
         manager = MultiPresetManager()
         preset = create_test_preset("test_exception", "__main__")
 
-        with patch("amrita_core.preset.AdapterManager") as mock_adapter_manager_class:
-            mock_instance = MagicMock()
-            mock_adapter_manager_class.return_value = mock_instance
+        with patch("amrita_core.preset.adapter_manager") as mock_instance:
             mock_instance.safe_get_adapter.return_value = FailingMockAdapter
 
             with patch("amrita_core.preset.hybrid_token_count", return_value=10):
@@ -285,9 +279,7 @@ class TestPresetTesting:
         manager.add_preset(preset1)
         manager.add_preset(preset2)
 
-        with patch("amrita_core.preset.AdapterManager") as mock_adapter_manager_class:
-            mock_instance = MagicMock()
-            mock_adapter_manager_class.return_value = mock_instance
+        with patch("amrita_core.preset.adapter_manager") as mock_instance:
             mock_instance.safe_get_adapter.return_value = MockModelAdapter
 
             with patch("amrita_core.preset.hybrid_token_count", return_value=10):
@@ -300,6 +292,40 @@ class TestPresetTesting:
                 assert {r.preset_name for r in reports} == {"gen1", "gen2"}
                 assert all(r.status is True for r in reports)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("concurrency", "max_concurrency"), [(2, 8), (None, 2)])
+    async def test_test_presets_concurrency(self, concurrency, max_concurrency):
+        """Test test_presets runs presets concurrently within the given bound"""
+        running = 0
+        peak = 0
+
+        class SlowMockAdapter(MockModelAdapter):
+            async def call_api(self, messages):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                async for response in super().call_api(messages):
+                    yield response
+
+        manager = MultiPresetManager()
+        manager.max_concurrency = max_concurrency
+        for i in range(5):
+            manager.add_preset(create_test_preset(f"slow{i}", "__main__"))
+
+        with patch("amrita_core.preset.adapter_manager") as mock_instance:
+            mock_instance.safe_get_adapter.return_value = SlowMockAdapter
+
+            with patch("amrita_core.preset.hybrid_token_count", return_value=10):
+                reports = [
+                    r async for r in manager.test_presets(concurrency=concurrency)
+                ]
+
+        assert len(reports) == 5
+        assert all(r.status is True for r in reports)
+        assert peak == 2
+
 
 class TestPresetReport:
     """Test PresetReport model"""
@@ -0,0 +1,115 @@
+import asyncio
+import base64
+import threading
+from io import BytesIO
+
+import pytest
+
+from amrita_core.protocol import (
+    AdapterManager,
+    ImageMessage,
+    ModelAdapter,
+    _get_image_session,
+    close_image_session,
+    get_image_format,
+)
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+PNG_MARKDOWN = f"![](data:image/png;base64,{base64.b64encode(PNG_BYTES).decode()})"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (b"\x89PNG\r\n\x1a\n", "png"),
+        (b"\xff\xd8\xff\xe0", "jpeg"),
+        (b"GIF89a", "gif"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "webp"),
+        (b"BM", "bmp"),
+        (b"not an image", None),
+    ],
+)
+def test_get_image_format(header: bytes, expected: str | None):
+    """Test image format detection from magic bytes"""
+    data = header + bytes(32)
+    assert get_image_format(data) == expected
+    assert get_image_format(memoryview(data)) == expected
+
+
+class TestImageMessage:
+    """Test ImageMessage rendering"""
+
+    def test_get_content_url(self):
+        """Test URL images are rendered as plain markdown links"""
+        msg = ImageMessage("https://example.com/image.png")
+        assert msg.get_content() == "![](https://example.com/image.png)"
+
+    def test_get_content_raw_bytes(self):
+        """Test raw image bytes are base64 encoded"""
+        msg = ImageMessage(BytesIO(PNG_BYTES))
+        assert msg.get_content() == PNG_MARKDOWN
+        assert msg._mime == "image/png"
+
+    def test_get_content_base64_bytes(self):
+        """Test already base64 encoded bytes are used as-is"""
+        msg = ImageMessage(base64.b64encode(PNG_BYTES))
+        assert msg.get_content() == PNG_MARKDOWN
+
+    def test_get_content_unsupported(self):
+        """Test unknown payloads are reported as unsupported"""
+        msg = ImageMessage(b"definitely not an image")
+        assert msg.get_content() == "[Unsupported image format]"
+
+    def test_get_content_cached(self):
+        """Test rendered content is cached until the image changes"""
+        msg = ImageMessage(PNG_BYTES)
+        content = msg.get_content()
+        assert msg.get_content() is content
+
+        msg.image = b"definitely not an image"
+        assert msg.get_content() == "[Unsupported image format]"
+
+    @pytest.mark.asyncio
+    async def test_image_session_closed_on_loop_change(self):
+        """Test a session left behind by another event loop is closed on it"""
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever)
+        thread.start()
+        try:
+            stale = asyncio.run_coroutine_threadsafe(
+                _get_image_session(), other
+            ).result(timeout=1)
+            session = await _get_image_session()
+            assert session is not stale
+            assert await _get_image_session() is session
+            for _ in range(100):
+                if stale.closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert stale.closed
+            assert not session.closed
+        finally:
+            await close_image_session()
+            other.call_soon_threadsafe(other.stop)
+            thread.join()
+            other.close()
+        assert session.closed
+
+
+class TestAdapterManager:
+    """Test AdapterManager registry behavior"""
+
+    def test_freeze(self):
+        """Test a frozen registry keeps lookups working and rejects registrations"""
+        # Use a detached instance so the shared registry is left untouched
+        manager = object.__new__(AdapterManager)
+        manager._adapter_class = {"mock": ModelAdapter}
+
+        manager.freeze()
+        assert manager.safe_get_adapter("mock") is ModelAdapter
+        assert manager.safe_get_adapter("missing") is None
+        assert manager.get_adapter("mock") is ModelAdapter
+        assert dict(manager.get_adapters()) == {"mock": ModelAdapter}
+
+        with pytest.raises(RuntimeError, match="frozen"):
+            manager.register_adapter(ModelAdapter)
@@ -1,9 +1,12 @@
 import asyncio
+from unittest.mock import patch
 
 import pytest
 
+from amrita_core.chatmanager import chat_manager
 from amrita_core.config import AmritaConfig
 from amrita_core.sessions import SessionsManager
+from amrita_core.tools.mcp import MCPClient
 
 
 class TestSessionsManager:
@@ -98,6 +101,9 @@ class TestSessionsManager:
             data.session_id for data in manager.get_registered_sessions().values()
         ]
 
+        # Dropping must not leave an empty running-objects entry behind
+        assert session_id not in chat_manager.running_chat_object
+
     def test_multiple_sessions(self):
         """Test multiple sessions"""
         manager = SessionsManager()
@@ -112,6 +118,10 @@ class TestSessionsManager:
         # Verify session count
         assert len(manager.get_registered_sessions()) == 3
 
+        # The registered sessions view is read-only
+        with pytest.raises(TypeError):
+            manager.get_registered_sessions()["new"] = None  # type: ignore[index]
+
         # Set different configurations for each session
         for i, sid in enumerate(session_ids):
             session_data = manager.get_session_data(sid)
@@ -166,3 +176,39 @@ async def test_async_session_operations():
 
     # Verify session still exists
     assert manager.is_session_registered(session_id)
+
+
+@pytest.mark.asyncio
+async def test_drop_session_closes_mcp_connections():
+    """Dropping a session closes the connections of its MCP clients"""
+    manager = SessionsManager()
+    session_id = manager.new_session()
+    manager.get_session_data(session_id).mcp.register_only(server_script="script")
+
+    with patch.object(MCPClient, "_close") as mock_close:
+        manager.drop_session(session_id)
+        await asyncio.sleep(0.01)
+        mock_close.assert_awaited_once()
+
+    other_id = manager.new_session()
+    manager.get_session_data(other_id).mcp.register_only(server_script="script")
+    with patch.object(MCPClient, "_close") as mock_close:
+        await manager.adrop_session(other_id)
+        mock_close.assert_awaited_once()
+    assert not manager.is_session_registered(other_id)
+
+
+def test_drop_session_without_event_loop_warns():
+    """Dropping a session outside an event loop can't close its MCP connections"""
+    manager = SessionsManager()
+    session_id = manager.new_session()
+    manager.get_session_data(session_id).mcp.register_only(server_script="script")
+
+    with (
+        patch.object(MCPClient, "_close") as mock_close,
+        patch("amrita_core.sessions.logger") as mock_logger,
+    ):
+        manager.drop_session(session_id)
+    mock_close.assert_not_called()
+    assert "adrop_session" in mock_logger.warning.call_args.args[0]
+    assert not manager.is_session_registered(session_id)
@@ -7,6 +7,7 @@ from amrita_core.utils import (
     get_current_datetime_timestamp,
     remove_think_tag,
     split_list,
+    split_list_view,
 )
 
 
@@ -18,6 +19,11 @@ def test_remove_think_tag():
     text_without_tags = "Hello world"
     assert remove_think_tag(text_without_tags) == text_without_tags
 
+    assert remove_think_tag("<think>\nplan\n</think>\n\n\nAnswer") == "Answer"
+    # Only the first complete think block is removed
+    assert remove_think_tag("<think>a</think>b<think>c</think>") == "b<think>c</think>"
+    assert remove_think_tag("<think>unterminated") == "<think>unterminated"
+
 
 def test_split_list():
     lst = [1, 2, 3, 4, 5, 6]
@@ -31,6 +37,23 @@ def test_split_list():
     assert split_list([1, 2, 3], 1) == [[1], [2], [3]]
 
 
+def test_split_list_view():
+    lst = [1, 2, 3, 4, 5, 6]
+    for threshold in range(1, 8):
+        chunks = [list(chunk) for chunk in split_list_view(lst, threshold)]
+        assert chunks == split_list(lst, threshold)
+    assert list(split_list_view([], 3)) == []
+    # Chunks are independent of each other
+    first, second = split_list_view([1, 2, 3, 4], 2)
+    assert list(second) == [3, 4]
+    assert list(first) == [1, 2]
+    assert [list(chunk) for chunk in split_list_view("abcde", 2)] == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+
+
 def test_get_current_datetime_timestamp():
     result = get_current_datetime_timestamp()
     match = re.search(